@@ -2,30 +2,31 @@
 Quick test using existing race data to verify the pipeline components.
 """
 
-import sys
 import pandas as pd
 from pathlib import Path
 
-# Add src to path
-sys.path.append(str(Path(__file__).parent / "src"))
-
 def test_with_existing_data():
     """Test the pipeline using existing race data."""
     print("🧪 QUICK PIPELINE TEST WITH EXISTING DATA")
     print("=" * 50)
     
-    # Check if we have existing race data
-    existing_files = [
-        "data/raw/accurate_greyhound_races_2025-07-13.csv",
-        "accurate_greyhound_races_2025-07-13.csv",
-        "test_race_data.csv"
-    ]
-    
+    # Discover existing race data: prefer Parquet snapshots, newest first
+    candidates = (
+        sorted(Path("data/raw").glob("race_cards_*.parquet"), reverse=True)
+        + sorted(Path("data/raw").glob("accurate_greyhound_races_*.parquet"), reverse=True)
+        + sorted(Path("data/raw").glob("race_cards_*.csv"), reverse=True)
+        + sorted(Path("data/raw").glob("accurate_greyhound_races_*.csv"), reverse=True)
+        + [Path("test_race_data.csv")]
+    )
+
     race_data = None
-    for file_path in existing_files:
+    for file_path in candidates:
         try:
-            if Path(file_path).exists():
-                race_data = pd.read_csv(file_path)
+            if file_path.exists():
+                if file_path.suffix == ".parquet":
+                    race_data = pd.read_parquet(file_path)
+                else:
+                    race_data = pd.read_csv(file_path)
                 print(f"✅ Loaded existing race data from: {file_path}")
                 print(f"   Shape: {race_data.shape}")
                 print(f"   Tracks: {', '.join(race_data['Track'].unique())}")
@@ -3,24 +3,169 @@ Dog statistics extractor module.
 Handles extraction of detailed historical stats for greyhounds.
 """
 
+import asyncio
+import csv
+import itertools
+import json
+import os
 import time
 import random
 import pandas as pd
 import requests
 import re
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Dict, Optional
-from urllib.parse import quote
+from typing import Iterable, List, Dict, Optional, Union
+from urllib.parse import quote, urlparse
+from urllib3.util import Retry
 
+try:
+    import aiohttp  # type: ignore
+except Exception:  # pragma: no cover - optional; threaded fallback is used without it
+    aiohttp = None  # type: ignore
+
+try:
+    import requests_cache  # type: ignore
+except Exception:  # pragma: no cover - optional; plain Session is used without it
+    requests_cache = None  # type: ignore
+
+from ..utils.config import config
 from ..utils.file_utils import save_to_csv
+from ..utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+# Compiled once: matches './images/trap_1.jpg'-style trap image sources
+_TRAP_IMG_RE = re.compile(r'trap_(\d+)\.')
+
+# Hot-path patterns for history-row extraction, compiled once instead of
+# paying re's cache probe per cell of every row
+_WS_RE = re.compile(r"\s+")
+_TRAP_SRC_RE = re.compile(r'trap[_-]?(\d+)', re.IGNORECASE)
+_TRAP_QP_RE = re.compile(r'[?&]trap=(\d+)', re.IGNORECASE)
+_TRAP_TXT_RE = re.compile(r'(?:trap|t)\s*(\d+)', re.IGNORECASE)
+# One pass over a cell's collected attributes/text: 'trap_3', 'trap-3',
+# 'trap 3' and 'trap=3' all resolve without re-serializing the cell
+_TRAP_ANY_RE = re.compile(r'trap[\s_=-]?(\d+)', re.IGNORECASE)
+
+# Stats parsing only ever touches <table> nodes; strain everything else
+# (head/script/nav) out at parse time instead of building the full tree
+_TABLE_STRAINER = SoupStrainer('table')
+
+# Search-result parsing only needs the anchors
+_ANCHOR_STRAINER = SoupStrainer('a')
+
+# History rows are emitted as plain tuples in this fixed order; building the
+# frame via from_records(columns=...) skips pandas' per-dict column inference
+_HISTORY_COLUMNS = (
+    'Date', 'Track', 'Dog', 'Trap', 'Grade', 'Distance', 'SP', 'Finish',
+    'Sectional', 'Time', 'Going', 'Calc_Time', 'Rating', 'Trainer',
+)
+
+# Low-cardinality history columns: stored as category codes instead of one
+# Python string object per row, shrinking frames from thousands-of-dogs runs
+_HISTORY_CATEGORY_COLUMNS = ('Track', 'Trap', 'Grade', 'Distance', 'Going', 'Trainer')
+
+# Purely numeric history columns, coerced to float32 at construction so
+# downstream ops are vectorized instead of parsing object strings
+_HISTORY_NUMERIC_COLUMNS = ('Sectional', 'Time', 'Calc_Time', 'Rating')
+
+# Modern desktop User-Agents, rotated round-robin per request so the client
+# fingerprint varies before the site ever serves a 403
+_USER_AGENTS = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/118.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/117.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/119.0',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/118.0',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15',
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (X11; Linux x86_64; rv:109.0) Gecko/20100101 Firefox/119.0',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36 Edg/119.0.0.0',
+)
+
+_ACCEPT_LANGUAGES = ('en-US,en;q=0.9', 'en-GB,en;q=0.9', 'en-GB,en-US;q=0.9,en;q=0.8')
+
+
+class AsyncTokenBucket:
+    """Adaptive token-bucket rate limiter shared by every fetch coroutine.
+
+    Tokens refill continuously at ``rate`` per second up to ``burst``, so the
+    overall request rate stays at a steady, tunable target no matter how many
+    coroutines are in flight. The rate adapts AIMD-style: each success nudges
+    it up additively (reward), a throttling response halves it and drains the
+    bucket, so throughput converges near what the server actually admits.
+    """
+
+    def __init__(self, rate: float, burst: int = 3,
+                 rate_min: float = 0.05, rate_max: float = 2.0, alpha: float = 0.02):
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self.rate_min = rate_min
+        self.rate_max = rate_max
+        self.alpha = alpha
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Sleep until a token is available, then consume it."""
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self.rate
+            await asyncio.sleep(wait)
+
+    def reward(self) -> None:
+        """Additive increase after a 2xx: probe for more server headroom."""
+        self.rate = min(self.rate_max, self.rate + self.alpha)
+
+    def throttle(self) -> None:
+        """Multiplicative decrease after 429/403/5xx: halve the refill rate
+        and drain queued tokens so in-flight coroutines pause immediately."""
+        self.rate = max(self.rate / 2.0, self.rate_min)
+        self._tokens = 0.0
+        self._updated = time.monotonic()
 
 
 class DogStatsExtractor:
     """Extractor for detailed dog statistics from greyhoundstats.co.uk"""
-    
+
+    # Dogs per worker future on the threaded path
+    _CHUNK_SIZE = 32
+
+    # Circuit breaker: trip when >50% of the last 30 responses are 403/429,
+    # so a hard IP block fails the remaining dogs fast instead of walking
+    # every one through the full retry/backoff cycle
+    _BREAKER_WINDOW = 30
+    _BREAKER_MIN_SAMPLES = 10
+    _BREAKER_COOLDOWN = 300.0
+
+
     def __init__(self, base_url: str = "https://greyhoundstats.co.uk/complete_runner_stats.php"):
         self.base_url = base_url
-        self.session = requests.Session()
+        if requests_cache is not None:
+            # Per-dog stats rarely change intra-day: replay cached responses
+            # locally for 12h, keyed on the full dog=&track= query string
+            from datetime import timedelta
+            self.session = requests_cache.CachedSession(
+                str(config.CACHE_DIR / "dog_stats_cache"),
+                backend='sqlite',
+                expire_after=timedelta(hours=12),
+                allowable_codes=(200,),
+                # Let origin Cache-Control/ETag drive revalidation so stale
+                # entries refresh with a cheap If-None-Match 304 round trip
+                cache_control=True,
+            )
+        else:
+            self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
@@ -33,172 +178,294 @@ class DogStatsExtractor:
             'Sec-Fetch-Site': 'none',
             'Cache-Control': 'max-age=0',
         })
+        self._ua_pool = itertools.cycle(_USER_AGENTS)
         self.request_delay = 2.0  # Start with 2 second delay between requests
         self.max_retries = 3
         self.backoff_factor = 2.0
+        # 429/5xx retries run at the connection-pool layer: urllib3 sleeps
+        # per Retry-After (or exponential backoff) before the response ever
+        # bubbles up to Python, so only 403 blocking is retried by hand
+        retry = Retry(
+            total=self.max_retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=('GET',),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        # Size the urllib3 pool to real concurrency so keep-alive connections
+        # survive the whole run instead of being discarded past the default 10
+        adapter = requests.adapters.HTTPAdapter(
+            max_retries=retry, pool_connections=32, pool_maxsize=32, pool_block=True
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # Async path: one bucket per host paces all coroutines at the same
+        # steady rate the sequential path used (2s delay -> 0.5 req/s), so a
+        # slow mirror never throttles a fast one; self._bucket is the bucket
+        # for the primary stats host
+        self._host_buckets: Dict[str, AsyncTokenBucket] = {}
+        self._bucket = self._bucket_for(self.base_url)
+        # Negative cache: dogs the site 404'd on stay missing between runs,
+        # so misspelled names do not re-hit the network every day
+        # (requests-cache only stores 200s per allowable_codes)
+        # Intra-run memo: duplicate (dog, track) lookups within one run cost
+        # a dict hit, before the sqlite response cache is even consulted
+        self._run_cache: Dict[tuple, Optional[list]] = {}
+        # Template position of the history table, learned from the first page
+        self._history_table_hint: Optional[int] = None
+        # Single-flight map: URL -> future of the fetch already in progress
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # Circuit-breaker state (see _record_status)
+        self._recent_status: deque = deque(maxlen=self._BREAKER_WINDOW)
+        self._breaker_open_until = 0.0
+        self._breaker_cooldown = self._BREAKER_COOLDOWN
+        self._missing_path = config.CACHE_DIR / "missing_dogs.json"
+        try:
+            self._missing = set(json.loads(self._missing_path.read_text()))
+        except (OSError, ValueError):
+            self._missing = set()
     
     def extract_dog_stats(self, race_data: pd.DataFrame, max_workers: int = 3) -> pd.DataFrame:
         """
         Extract detailed stats for all dogs in race data.
-        
+
+        Prefers the asyncio + aiohttp path (network I/O-bound work with one
+        host: far cheaper per in-flight request than threads); falls back to
+        the ThreadPoolExecutor path when aiohttp is unavailable.
+
         Args:
             race_data: DataFrame containing race card data with dog names
-            max_workers: Number of concurrent threads for extraction (reduced for rate limiting)
-            
+            max_workers: Concurrent request limit (semaphore permits / threads)
+
         Returns:
             DataFrame with detailed dog statistics
         """
-        unique_dogs = race_data['Dog_Name'].unique()
-        print(f"Extracting RAW site stats for {len(unique_dogs)} unique dogs...")
-        print(f"Using {max_workers} workers with {self.request_delay}s delay between requests")
+        self._run_cache.clear()
+        unique_dogs = self._unique_dog_names(race_data['Dog_Name'])
+        logger.info("Extracting RAW site stats for %d unique dogs...", len(unique_dogs))
+
+        if aiohttp is not None:
+            return asyncio.run(self.extract_dog_stats_async(unique_dogs, concurrency=max_workers))
+
+        logger.info("Using %d workers with %.1fs delay between requests", max_workers, self.request_delay)
 
         all_stats = []
         failed_dogs = []
 
-        # Use sequential processing for better rate limiting control
-        if max_workers == 1:
-            print("Using sequential processing for better rate limiting...")
-            for i, dog_name in enumerate(unique_dogs, 1):
-                print(f"Progress: {i}/{len(unique_dogs)} - Processing {dog_name}")
-
-                stats = self._get_dog_stats_with_retry(dog_name)
-                if stats:
-                    if isinstance(stats, list):
-                        all_stats.extend(stats)
-                    else:
-                        all_stats.append(stats)
-                    print(f"✓ Stats extracted for {dog_name}")
-                else:
-                    failed_dogs.append(dog_name)
-                    print(f"✗ Failed to extract stats for {dog_name}")
+        # Rows stream to an on-disk progress log as futures resolve, so an
+        # interrupted run resumes where it stopped instead of refetching
+        progress_path = config.CACHE_DIR / "dog_stats_progress.csv"
+        done_dogs = set()
+        if progress_path.exists():
+            try:
+                prior = pd.read_csv(progress_path, dtype=str, keep_default_na=False)
+                done_dogs = {name.casefold() for name in prior['Queried_Dog'].unique()}
+                all_stats.extend(prior[list(_HISTORY_COLUMNS)].itertuples(index=False, name=None))
+                logger.info("Resuming: %d dogs already completed in %s", len(done_dogs), progress_path.name)
+            except Exception as e:
+                logger.warning("Could not resume from %s: %s", progress_path.name, e)
+        pending_dogs = [d for d in unique_dogs if d.casefold() not in done_dogs]
 
-                # Add delay between requests
-                if i < len(unique_dogs):  # Don't sleep after the last request
-                    delay = self.request_delay + random.uniform(0.5, 1.5)  # Add random jitter
-                    time.sleep(delay)
-        else:
-            # Use ThreadPoolExecutor with rate limiting
+        progress_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(progress_path, 'a', newline='', encoding='utf-8') as progress_file:
+            writer = csv.writer(progress_file)
+            if progress_file.tell() == 0:
+                writer.writerow(('Queried_Dog',) + _HISTORY_COLUMNS)
+
+            # One concurrency-aware path: max_workers=1 simply serializes through
+            # the pool, so sequential runs share the retry/reporting logic.
+            # Dogs are bucketed ~32 per future to amortize executor scheduling
+            # and as_completed heap churn on tens-of-thousands-dog runs
+            chunks = [
+                pending_dogs[i:i + self._CHUNK_SIZE]
+                for i in range(0, len(pending_dogs), self._CHUNK_SIZE)
+            ]
+            processed = 0
             with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                # Submit all tasks
-                future_to_dog = {
-                    executor.submit(self._get_dog_stats_with_retry, dog_name): dog_name
-                    for dog_name in unique_dogs
-                }
-
-                # Collect results
-                for future in as_completed(future_to_dog):
-                    dog_name = future_to_dog[future]
+                futures = [executor.submit(self._process_chunk, chunk) for chunk in chunks]
+
+                # Per-dog outcomes go to DEBUG so progress is one line per
+                # resolved chunk rather than one stdout flush per dog
+                for future in as_completed(futures):
                     try:
-                        stats = future.result()
+                        chunk_results = future.result()
+                    except Exception as e:
+                        logger.warning("Worker chunk failed: %s", e)
+                        continue
+                    for dog_name, stats in chunk_results:
+                        processed += 1
                         if stats:
                             if isinstance(stats, list):
                                 all_stats.extend(stats)
+                                writer.writerows((dog_name,) + row for row in stats)
                             else:
                                 all_stats.append(stats)
-                            print(f"✓ Stats extracted for {dog_name}")
+                            logger.debug("Stats extracted for %s", dog_name)
                         else:
                             failed_dogs.append(dog_name)
-                            print(f"✗ No stats found for {dog_name}")
-                    except Exception as e:
-                        failed_dogs.append(dog_name)
-                        print(f"✗ Error extracting stats for {dog_name}: {e}")
+                            logger.debug("No stats found for %s", dog_name)
+                    progress_file.flush()
+                    logger.info("Progress: %d/%d dogs processed", processed, len(pending_dogs))
+
+        # Run completed: the progress log has served its purpose
+        try:
+            progress_path.unlink()
+        except OSError:
+            pass
+
+        self._save_missing_dogs()
 
         # Report results
         if failed_dogs:
-            print(f"\n⚠️  Failed to extract stats for {len(failed_dogs)} dogs:")
-            for dog in failed_dogs[:10]:  # Show first 10 failed dogs
-                print(f"   - {dog}")
-            if len(failed_dogs) > 10:
-                print(f"   ... and {len(failed_dogs) - 10} more")
+            logger.warning(
+                "Failed to extract stats for %d dogs: %s%s",
+                len(failed_dogs),
+                ", ".join(failed_dogs[:10]),
+                f" ... and {len(failed_dogs) - 10} more" if len(failed_dogs) > 10 else "",
+            )
 
         if all_stats:
-            stats_df = pd.DataFrame(all_stats)
-            print(f"\n✅ Successfully extracted raw stats for {len(stats_df)} out of {len(unique_dogs)} dogs")
+            stats_df = self._compact_stats_frame(
+                pd.DataFrame.from_records(all_stats, columns=_HISTORY_COLUMNS)
+            )
+            logger.info("Successfully extracted raw stats for %d out of %d dogs", len(stats_df), len(unique_dogs))
             return stats_df
         else:
-            print("\n❌ No raw stats extracted")
+            logger.warning("No raw stats extracted")
             return pd.DataFrame()
     
+    def _process_chunk(self, dog_names: List[str]) -> List[tuple]:
+        """Fetch a bucket of dogs sequentially on one worker thread."""
+        return [(name, self._get_dog_stats_with_retry(name)) for name in dog_names]
+
+    def _save_missing_dogs(self) -> None:
+        """Persist the known-404 dog names for future runs (best effort)."""
+        try:
+            self._missing_path.parent.mkdir(parents=True, exist_ok=True)
+            self._missing_path.write_text(json.dumps(sorted(self._missing)))
+        except OSError as e:
+            logger.warning("Could not persist missing-dog cache: %s", e)
+
     def _get_dog_stats_with_retry(self, dog_name: str, track_name: str = None) -> Optional[Dict]:
         """
-        Get detailed statistics for a single dog with retry logic and error handling.
-        
+        Get detailed statistics for a single dog with error handling.
+
+        429/5xx retries (including Retry-After waits) already happened at
+        the adapter layer, so only 403 blocking - which needs header
+        rotation the pool can't do - is retried here.
+
         Args:
             dog_name: Name of the dog
             track_name: Optional track name to filter by
-            
+
         Returns:
             Dictionary with dog statistics or None if not found
         """
         for attempt in range(self.max_retries):
             try:
                 return self._get_dog_stats(dog_name, track_name)
-            
+
             except requests.exceptions.HTTPError as e:
-                if e.response.status_code == 403:
-                    print(f"   ⚠️  403 Forbidden for {dog_name} (attempt {attempt + 1}/{self.max_retries})")
+                status = e.response.status_code
+                if status == 403:
+                    logger.warning("403 Forbidden for %s (attempt %d/%d)", dog_name, attempt + 1, self.max_retries)
                     if attempt < self.max_retries - 1:
-                        # Increase delay and try different headers
+                        # Try different headers, then sleep with full jitter:
+                        # uniform over the exponential window desynchronizes
+                        # concurrent workers retrying after the same block
                         self._adjust_for_blocking()
-                        delay = self.request_delay * (attempt + 2)
-                        print(f"   ⏳ Waiting {delay:.1f}s before retry...")
-                        time.sleep(delay)
-                        continue
-                    else:
-                        print(f"   ❌ Giving up on {dog_name} after {self.max_retries} 403 errors")
-                        return None
-                        
-                elif e.response.status_code == 429:
-                    print(f"   ⚠️  429 Rate Limited for {dog_name} (attempt {attempt + 1}/{self.max_retries})")
-                    if attempt < self.max_retries - 1:
-                        # Exponential backoff for rate limiting
-                        delay = self.request_delay * (self.backoff_factor ** (attempt + 1))
-                        delay += random.uniform(1, 3)  # Add jitter
-                        print(f"   ⏳ Rate limited - waiting {delay:.1f}s before retry...")
+                        retry_after = e.response.headers.get('Retry-After')
+                        if retry_after and retry_after.replace('.', '', 1).isdigit():
+                            delay = min(float(retry_after), 60.0)
+                        else:
+                            delay = random.uniform(0, min(60.0, self.request_delay * (2 ** attempt)))
+                        logger.info("Waiting %.1fs before retry...", delay)
                         time.sleep(delay)
                         continue
-                    else:
-                        print(f"   ❌ Giving up on {dog_name} after {self.max_retries} rate limit errors")
-                        return None
-                        
-                elif e.response.status_code == 404:
-                    print(f"   ℹ️  Dog not found: {dog_name}")
+                    logger.error("Giving up on %s after %d 403 errors", dog_name, self.max_retries)
                     return None
-                    
-                else:
-                    print(f"   ❌ HTTP {e.response.status_code} error for {dog_name}: {e}")
-                    if attempt < self.max_retries - 1:
-                        delay = self.request_delay * (attempt + 1)
-                        time.sleep(delay)
-                        continue
+
+                if status == 404:
+                    logger.info("Dog not found: %s", dog_name)
+                    self._missing.add(dog_name)
                     return None
-                    
+
+                # 429/5xx surfacing here means the adapter's retries are spent
+                logger.error("HTTP %s error for %s after adapter retries: %s", status, dog_name, e)
+                return None
+
             except requests.exceptions.RequestException as e:
-                print(f"   ⚠️  Network error for {dog_name} (attempt {attempt + 1}/{self.max_retries}): {e}")
-                if attempt < self.max_retries - 1:
-                    delay = self.request_delay * (attempt + 1)
-                    time.sleep(delay)
-                    continue
+                logger.warning("Network error for %s: %s", dog_name, e)
                 return None
-                
+
             except Exception as e:
-                print(f"   ❌ Unexpected error for {dog_name}: {e}")
+                logger.error("Unexpected error for %s: %s", dog_name, e)
                 return None
-        
+
         return None
     
+    def _bucket_for(self, url: str) -> AsyncTokenBucket:
+        """Return (creating on first use) the rate bucket for a URL's host."""
+        host = urlparse(url).netloc
+        bucket = self._host_buckets.get(host)
+        if bucket is None:
+            bucket = AsyncTokenBucket(rate=1.0 / self.request_delay, burst=3)
+            self._host_buckets[host] = bucket
+        return bucket
+
+    @staticmethod
+    def _note_rate_headers(bucket: AsyncTokenBucket, headers) -> None:
+        """Reactively throttle when the server advertises a near-empty quota,
+        instead of waiting to trip a 429."""
+        remaining = headers.get('X-RateLimit-Remaining')
+        limit = headers.get('X-RateLimit-Limit')
+        try:
+            if remaining is not None and limit and float(remaining) < 0.1 * float(limit):
+                bucket.throttle()
+                logger.info(
+                    "Server quota low (%s/%s remaining) - rate now %.2f req/s",
+                    remaining, limit, bucket.rate,
+                )
+        except ValueError:
+            pass
+
+    def _breaker_allows(self) -> bool:
+        """True while the circuit is closed (or the cooldown has lapsed,
+        letting the next request through as a half-open probe)."""
+        return time.monotonic() >= self._breaker_open_until
+
+    def _record_status(self, status: int) -> None:
+        """Feed the breaker: a 2xx closes it and resets the cooldown; a
+        window majority of 403/429 trips it OPEN with doubling cooldowns."""
+        self._recent_status.append(status)
+        if status < 400:
+            self._breaker_cooldown = self._BREAKER_COOLDOWN
+            return
+        blocked = sum(1 for s in self._recent_status if s in (403, 429))
+        if (len(self._recent_status) >= self._BREAKER_MIN_SAMPLES
+                and blocked / len(self._recent_status) > 0.5):
+            self._breaker_open_until = time.monotonic() + self._breaker_cooldown
+            logger.error(
+                "Circuit breaker OPEN: %d/%d recent responses blocked; pausing %.0fs",
+                blocked, len(self._recent_status), self._breaker_cooldown,
+            )
+            self._breaker_cooldown = min(self._breaker_cooldown * 2, 3600.0)
+            self._recent_status.clear()
+
+    def _prepare_headers(self) -> Dict[str, str]:
+        """Per-request header overrides: next UA in the rotation plus a
+        varied Accept-Language, without mutating the session defaults."""
+        return {
+            'User-Agent': next(self._ua_pool),
+            'Accept-Language': random.choice(_ACCEPT_LANGUAGES),
+        }
+
     def _adjust_for_blocking(self):
         """Adjust headers and settings when getting blocked."""
         # Rotate user agent
-        user_agents = [
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/118.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/119.0',
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36'
-        ]
-        
-        self.session.headers['User-Agent'] = random.choice(user_agents)
-        
+        self.session.headers['User-Agent'] = next(self._ua_pool)
+
         # Increase delay
         self.request_delay = min(self.request_delay * 1.5, 10.0)  # Cap at 10 seconds
     
@@ -213,28 +480,218 @@ class DogStatsExtractor:
         Returns:
             Dictionary with dog statistics or None if not found
         """
+        if dog_name in self._missing:
+            logger.debug("Skipping %s: known 404 from a previous run", dog_name)
+            return None
+
+        memo_key = (dog_name, track_name)
+        if memo_key in self._run_cache:
+            return self._run_cache[memo_key]
+
+        if not self._breaker_allows():
+            logger.debug("Circuit open - skipping %s", dog_name)
+            return None
+
         try:
-            # URL encode the dog name for the query
-            encoded_dog_name = quote(dog_name)
-            encoded_track_name = quote(track_name) if track_name else ""
-            
-            # Build the URL using the working pattern from the old file
-            params = f"?dog={encoded_dog_name}&track={encoded_track_name}&pos=&trap=&grade=&distance="
-            url = self.base_url + params
-            
-            print(f"Fetching stats for {dog_name}")
-            
+            url = self._build_stats_url(dog_name, track_name)
+
+            logger.debug("Fetching stats for %s", dog_name)
+
             # Make the request
-            response = self.session.get(url, timeout=10)
+            response = self.session.get(url, timeout=10, headers=self._prepare_headers())
+            self._record_status(response.status_code)
             response.raise_for_status()
-            
-            # Parse the response
-            return self._parse_dog_stats(response.text, dog_name)
-            
+
+            # Parse raw bytes: lxml sniffs the encoding, skipping the
+            # full-body str decode (mirrors the async path)
+            stats = self._parse_dog_stats(response.content, dog_name)
+            self._run_cache[memo_key] = stats
+            return stats
+
+        except requests.exceptions.RequestException:
+            # Let HTTP/network errors propagate so the retry wrapper can
+            # inspect status codes (429 Retry-After, 403 header rotation)
+            raise
         except Exception as e:
-            print(f"Error getting stats for {dog_name}: {e}")
+            logger.error("Error getting stats for %s: %s", dog_name, e)
             return None
     
+    @staticmethod
+    def _compact_stats_frame(stats_df: pd.DataFrame) -> pd.DataFrame:
+        """Cast low-cardinality columns to category dtype to shrink the frame.
+
+        Category codes cut the repeated track/grade/trainer strings down to
+        one stored value each; sectional/time/rating cells parse cleanly as
+        floats, so they become float32 (unparseable cells -> NaN). Date and
+        SP keep their site text: fraction odds and mixed date formats don't
+        coerce losslessly.
+        """
+        stats_df = stats_df.astype({col: 'category' for col in _HISTORY_CATEGORY_COLUMNS})
+        for col in _HISTORY_NUMERIC_COLUMNS:
+            stats_df[col] = pd.to_numeric(stats_df[col], errors='coerce').astype('float32')
+        return stats_df
+
+    @staticmethod
+    def _unique_dog_names(names: pd.Series) -> List[str]:
+        """Deduplicate dog names, folding whitespace/case variants together.
+
+        Trivial variants (" Fast Eddie" vs "Fast Eddie") would otherwise each
+        trigger an HTTP fetch and a distinct cache key. The first-seen stripped
+        spelling is kept so the site query and output use familiar casing.
+        """
+        seen: Dict[str, str] = {}
+        for name in names.dropna().astype(str):
+            stripped = name.strip()
+            if not stripped:
+                continue
+            key = stripped.casefold()
+            if key not in seen:
+                seen[key] = stripped
+        return list(seen.values())
+
+    def _build_stats_url(self, dog_name: str, track_name: str = None) -> str:
+        """Build the complete_runner_stats query URL for a dog."""
+        encoded_dog_name = quote(dog_name)
+        encoded_track_name = quote(track_name) if track_name else ""
+        params = f"?dog={encoded_dog_name}&track={encoded_track_name}&pos=&trap=&grade=&distance="
+        return self.base_url + params
+
+    async def _fetch_dog_stats_async(self, session, semaphore, parse_pool, dog_name: str) -> Optional[List[tuple]]:
+        """Fetch one dog's stats page, parsing off the event loop (best effort).
+
+        Concurrent requests for the same URL coalesce: later callers await
+        the in-flight fetch's future instead of re-hitting the network and
+        parser (single-flight; complements the persistent cache).
+        """
+        if dog_name in self._missing:
+            logger.debug("Skipping %s: known 404 from a previous run", dog_name)
+            return None
+        url = self._build_stats_url(dog_name)
+        existing = self._inflight.get(url)
+        if existing is not None:
+            return await existing
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[url] = future
+        try:
+            result = await self._fetch_one_async(session, semaphore, parse_pool, dog_name, url)
+        except BaseException:
+            self._inflight.pop(url, None)
+            future.cancel()
+            raise
+        future.set_result(result)
+        self._inflight.pop(url, None)
+        return result
+
+    async def _fetch_one_async(self, session, semaphore, parse_pool,
+                               dog_name: str, url: str) -> Optional[List[tuple]]:
+        """The actual bounded fetch + off-loop parse for one URL."""
+        async with semaphore:
+            try:
+                if not self._breaker_allows():
+                    logger.debug("Circuit open - skipping %s", dog_name)
+                    return None
+                bucket = self._bucket_for(url)
+                await bucket.acquire()
+                async with session.get(url, headers=self._prepare_headers()) as response:
+                    self._record_status(response.status)
+                    response.raise_for_status()
+                    self._note_rate_headers(bucket, response.headers)
+                    # Raw bytes: aiohttp has already decompressed; lxml sniffs
+                    # the encoding itself, so skip the str decode round-trip
+                    body = await response.read()
+                bucket.reward()
+                # lxml parsing of a multi-KB page would stall every other
+                # in-flight fetch; run it on the parse pool instead
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(parse_pool, self._parse_dog_stats, body, dog_name)
+            except aiohttp.ClientResponseError as e:
+                if e.status == 404:
+                    logger.info("Dog not found: %s", dog_name)
+                    self._missing.add(dog_name)
+                elif e.status == 429 or e.status == 403 or e.status >= 500:
+                    # Adaptive AIMD: back the host's bucket off for everyone
+                    bucket.throttle()
+                    logger.warning(
+                        "HTTP %s for %s - bucket rate halved to %.2f req/s",
+                        e.status, dog_name, bucket.rate
+                    )
+                    retry_after = (e.headers or {}).get('Retry-After')
+                    if retry_after and retry_after.replace('.', '', 1).isdigit():
+                        await asyncio.sleep(min(float(retry_after), 60.0))
+                else:
+                    logger.warning("HTTP %s for %s: %s", e.status, dog_name, e.message)
+                return None
+            except Exception as e:
+                logger.warning("Error extracting stats for %s: %s", dog_name, e)
+                return None
+
+    async def extract_dog_stats_async(self, dog_names: Iterable[str], concurrency: int = 16) -> pd.DataFrame:
+        """
+        Extract stats for the given dogs concurrently via an asyncio + aiohttp queue.
+
+        Args:
+            dog_names: Iterable of dog names to fetch
+            concurrency: Maximum number of in-flight requests
+
+        Returns:
+            DataFrame with raw stats rows (empty if nothing was extracted)
+        """
+        if aiohttp is None:
+            raise ImportError("aiohttp is required for async extraction. Install requirements.txt")
+
+        dogs = list(dog_names)
+        self._inflight.clear()  # futures from any previous event loop are dead
+        semaphore = asyncio.Semaphore(concurrency)
+        # Hold keep-alive sockets for the whole run so the token-bucket gaps
+        # between requests never force a fresh TCP+TLS handshake
+        connector = aiohttp.TCPConnector(
+            limit=concurrency, limit_per_host=concurrency, ttl_dns_cache=300,
+            keepalive_timeout=75,
+        )
+        timeout = aiohttp.ClientTimeout(total=30, connect=10, sock_read=10)
+        parse_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+        try:
+            async with aiohttp.ClientSession(
+                connector=connector, headers=dict(self.session.headers), timeout=timeout
+            ) as session:
+                results = await asyncio.gather(
+                    *(self._fetch_dog_stats_async(session, semaphore, parse_pool, name) for name in dogs)
+                )
+        finally:
+            parse_pool.shutdown()
+            self._save_missing_dogs()
+
+        all_stats: List[tuple] = []
+        failed_dogs: List[str] = []
+        for dog_name, stats in zip(dogs, results):
+            if stats:
+                if isinstance(stats, list):
+                    all_stats.extend(stats)
+                else:
+                    all_stats.append(stats)
+            else:
+                failed_dogs.append(dog_name)
+
+        if failed_dogs:
+            logger.warning(
+                "Failed to extract stats for %d dogs: %s%s",
+                len(failed_dogs),
+                ", ".join(failed_dogs[:10]),
+                f" ... and {len(failed_dogs) - 10} more" if len(failed_dogs) > 10 else "",
+            )
+
+        if all_stats:
+            stats_df = self._compact_stats_frame(
+                pd.DataFrame.from_records(all_stats, columns=_HISTORY_COLUMNS)
+            )
+            logger.info(
+                "Successfully extracted raw stats for %d rows across %d of %d dogs",
+                len(stats_df), len(dogs) - len(failed_dogs), len(dogs),
+            )
+            return stats_df
+        logger.warning("No raw stats extracted")
+        return pd.DataFrame()
+
     def _parse_search_results(self, html: str, dog_name: str) -> Optional[str]:
         """
         Parse search results to find the correct dog URL.
@@ -247,43 +704,95 @@ class DogStatsExtractor:
             URL to dog's detail page or None if not found
         """
         try:
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html, 'html.parser')
-            
+            soup = BeautifulSoup(html, 'lxml', parse_only=_ANCHOR_STRAINER)
+
             # Look for dog links in search results
             dog_links = soup.find_all('a', href=lambda x: x and '/dog/' in x)
             
             for link in dog_links:
-                link_text = link.get_text().strip()
+                link_text = link.get_text(strip=True)
                 if dog_name.lower() in link_text.lower():
                     return f"{self.base_url}{link.get('href')}"
             
             return None
             
         except Exception as e:
-            print(f"Error parsing search results for {dog_name}: {e}")
+            logger.error("Error parsing search results for %s: %s", dog_name, e)
             return None
     
-    def _parse_dog_stats(self, html: str, dog_name: str) -> Optional[Dict]:
+    def _parse_dog_stats(self, html: Union[str, bytes], dog_name: str) -> Optional[List[tuple]]:
         """
         Parse RAW statistics from the dog's page (as-is from the site).
+        Accepts str or raw response bytes (lxml detects the encoding).
         Returns only values as presented by the summary table (no derived fields).
         """
         try:
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, 'lxml', parse_only=_TABLE_STRAINER)
 
-            # Return the raw race history table rows for this dog
-            rows = self._extract_history_table_rows(soup, dog_name)
-            return rows
+            # One DOM walk classifies every table; sub-parsers get their node
+            tables = self._classify_tables(soup)
+            history_table = tables.get('history')
+            if history_table is None:
+                return []
+            return self._extract_history_table_rows(history_table, dog_name)
 
         except Exception as e:
-            print(f"Error parsing raw stats for {dog_name}: {e}")
+            logger.error("Error parsing raw stats for %s: %s", dog_name, e)
             return None
+
+    @staticmethod
+    def _table_headers(table) -> List[str]:
+        """Return normalized header texts for a table (th, or first-row td)."""
+        header_cells = table.find_all('th')
+        if not header_cells:
+            first_row = table.find('tr')
+            header_cells = first_row.find_all('td') if first_row else []
+        return [_WS_RE.sub(" ", h.get_text() or "").strip() for h in header_cells]
+
+    @staticmethod
+    def _is_history_headers(headers: List[str]) -> bool:
+        """True when the header row carries the race-history signature."""
+        return all(
+            any(th.lower() in h.lower() for h in headers)
+            for th in ('Date', 'Track', 'Dog', 'Trap', 'Grade')
+        )
+
+    def _classify_tables(self, soup) -> Dict[str, object]:
+        """Walk the page's tables once and classify each by header signature.
+
+        Returns a dict with optional 'summary' (Runs/Wins/Win %) and 'history'
+        (Date/Track/Dog/Trap/Grade) table nodes, so sub-parsers do not each
+        re-scan every table on the page. Stats pages share one template, so
+        the history table's position from the previous page is tried first
+        and the scan is skipped entirely while the signature keeps matching.
+        """
+        classified: Dict[str, object] = {}
+        tables = soup.find_all('table')
+
+        hint = self._history_table_hint
+        if hint is not None and hint < len(tables):
+            headers = self._table_headers(tables[hint])
+            if headers and self._is_history_headers(headers):
+                classified['history'] = tables[hint]
+                return classified
+
+        for idx, table in enumerate(tables):
+            headers = self._table_headers(table)
+            if not headers:
+                continue
+            if 'summary' not in classified and {'Runs', 'Wins', 'Win %'} <= set(headers):
+                classified['summary'] = table
+            elif 'history' not in classified and self._is_history_headers(headers):
+                classified['history'] = table
+                self._history_table_hint = idx
+            if len(classified) == 2:
+                break
+        return classified
     
-    def _extract_summary_stats_raw(self, soup, dog_name, track_name=None):
+    def _extract_summary_stats_raw(self, table, dog_name, track_name=None):
         """
-        Extract the summary statistics table (Runs, Wins, Win %) as raw text values.
+        Extract raw text values from a pre-classified summary table
+        (Runs, Wins, Win %) as selected by _classify_tables.
         """
         summary = {
             'dog_name': dog_name,
@@ -293,71 +802,67 @@ class DogStatsExtractor:
         }
 
         try:
-            # Find the summary table - it's the first table with Runs, Wins, Win %
-            tables = soup.find_all('table')
-
-            for table in tables:
-                # Look for table with headers "Runs", "Wins", "Win %"
-                headers = table.find_all('th') if table.find('th') else table.find_all('td')
-                if len(headers) >= 3:
-                    header_text = [h.get_text().strip() for h in headers]
-                    if 'Runs' in header_text and 'Wins' in header_text and 'Win %' in header_text:
-                        # Found the summary table
-                        rows = table.find_all('tr')
-                        if len(rows) > 1:  # Skip header row
-                            data_row = rows[1]
-                            cells = data_row.find_all('td')
-                            if len(cells) >= 3:
-                                summary['runs'] = cells[0].get_text().strip()
-                                summary['wins'] = cells[1].get_text().strip()
-                                summary['win_percent'] = cells[2].get_text().strip()
-                                break
+            rows = table.find_all('tr') if table is not None else []
+            if len(rows) > 1:  # Skip header row
+                cells = rows[1].find_all('td')
+                if len(cells) >= 3:
+                    summary['runs'] = cells[0].get_text(strip=True)
+                    summary['wins'] = cells[1].get_text(strip=True)
+                    summary['win_percent'] = cells[2].get_text(strip=True)
 
         except Exception as e:
-            print(f"Error extracting raw summary stats: {e}")
+            logger.error("Error extracting raw summary stats: %s", e)
 
         return summary
 
-    def _extract_history_table_rows(self, soup, dog_name) -> List[Dict]:
+    @staticmethod
+    def _trap_haystack(cell) -> str:
+        """Join a cell's attribute values and text in one descendant walk."""
+        parts: List[str] = []
+        if cell.attrs:
+            for value in cell.attrs.values():
+                parts.extend(value) if isinstance(value, list) else parts.append(str(value))
+        for el in cell.descendants:
+            attrs = getattr(el, 'attrs', None)
+            if attrs:
+                for value in attrs.values():
+                    parts.extend(value) if isinstance(value, list) else parts.append(str(value))
+            elif isinstance(el, NavigableString):
+                parts.append(str(el))
+        return ' '.join(parts)
+
+    def _extract_history_table_rows(self, table, dog_name) -> List[tuple]:
         """
-    Extract rows from the RAW race history table with headers:
+    Extract rows from the RAW race history table (pre-classified by
+    _classify_tables) as tuples in _HISTORY_COLUMNS order:
     Date, Track, Dog, Trap, Grade, Distance, SP, Finish, Sectional, Time,
     Going, Calc. Time, Rating, Trainer
         """
         def normalize(text: str) -> str:
-            return re.sub(r"\s+", " ", text or "").strip()
+            return _WS_RE.sub(" ", text or "").strip()
 
-        tables = soup.find_all('table')
-        results: List[Dict] = []
-        for table in tables:
-            # Collect header texts
-            header_cells = table.find_all('th')
-            if not header_cells:
-                # Some pages use td for headers
-                first_row = table.find('tr')
-                header_cells = first_row.find_all('td') if first_row else []
-            headers = [normalize(h.get_text()) for h in header_cells]
-            # Check if this table matches the expected header subset
-            if headers and all(any(th.lower() in h.lower() for h in headers) for th in ['Date', 'Track', 'Dog', 'Trap', 'Grade']):
-                # Iterate rows after header
+        results: List[tuple] = []
+        if table is not None:
                 for row in table.find_all('tr')[1:]:
                     cells = row.find_all('td')
                     if not cells:
                         continue
+                    # One traversal per row: fetch every cell's text up front
+                    # instead of a tree walk per column lookup
+                    texts = [normalize(c.get_text(' ', strip=True)) for c in cells]
                     # Skip AVERAGE/AVERAGES summary row
-                    if normalize(cells[0].get_text()).upper().startswith('AVERAGE'):
+                    if texts[0].upper().startswith('AVERAGE'):
                         continue
                     # Guard length
                     if len(cells) < 12:
                         continue
+                    if len(texts) < 14:
+                        texts.extend([''] * (14 - len(texts)))
                     try:
-                        def cell_text(idx: int) -> str:
-                            return normalize(cells[idx].get_text()) if idx < len(cells) else ''
-
                         # Date (text inside anchor)
-                        date_text = cell_text(0)
+                        date_text = texts[0]
                         # Track
-                        track_text = cell_text(1)
+                        track_text = texts[1]
                         # Trap column is index 2
                         trap = ''
                         cell_trap = cells[2] if len(cells) > 2 else None
@@ -365,121 +870,75 @@ class DogStatsExtractor:
                             img = cell_trap.find('img')
                             if img:
                                 src = img.get('src') or img.get('data-src') or img.get('data-original') or ''
-                                m = re.search(r'trap[_-]?(\d+)', src, re.IGNORECASE)
-                                if m:
-                                    trap = m.group(1)
-                            if not trap:
-                                a = cell_trap.find('a')
-                                if a and a.get('href'):
-                                    m = re.search(r'[?&]trap=(\d+)', a.get('href'), re.IGNORECASE)
-                                    if m:
-                                        trap = m.group(1)
-                            if not trap:
-                                # Check class names or alt/title
-                                cls = ' '.join(cell_trap.get('class', [])).strip()
-                                alt = img.get('alt', '') if img else ''
-                                title = img.get('title', '') if img else ''
-                                combined = ' '.join([cls, alt, title])
-                                m = re.search(r'trap[_-\s]?(\d+)', combined, re.IGNORECASE)
+                                m = _TRAP_SRC_RE.search(src)
                                 if m:
                                     trap = m.group(1)
                             if not trap:
-                                # Last resort: search raw HTML for trap_# pattern
-                                html = str(cell_trap)
-                                m = re.search(r'trap[_-]?(\d+)', html, re.IGNORECASE)
+                                # One descendant walk collects every attribute
+                                # value and text fragment (href/class/alt/
+                                # title/...), then a single regex pass - no
+                                # re-serializing the cell back to HTML
+                                m = _TRAP_ANY_RE.search(self._trap_haystack(cell_trap))
                                 if m:
                                     trap = m.group(1)
                             if not trap:
                                 txt = cell_trap.get_text(' ', strip=True)
-                                m = re.search(r'(?:trap|t)\s*(\d+)', txt, re.IGNORECASE)
+                                m = _TRAP_TXT_RE.search(txt)
                                 if m:
                                     trap = m.group(1)
                         # Dog (site includes it; also store Dog_Name)
-                        dog_text = cell_text(3) or dog_name
+                        dog_text = texts[3] or dog_name
                         # Grade
-                        grade_text = cell_text(4)
+                        grade_text = texts[4]
                         # Distance
-                        distance_text = cell_text(5)
+                        distance_text = texts[5]
                         # SP
-                        sp_text = cell_text(6)
+                        sp_text = texts[6]
                         # Finish
-                        finish_text = cell_text(7)
+                        finish_text = texts[7]
                         # Sectional
-                        sectional_text = cell_text(8)
+                        sectional_text = texts[8]
                         # Time
-                        time_text = cell_text(9)
+                        time_text = texts[9]
                         # Going
-                        going_text = cell_text(10)
+                        going_text = texts[10]
                         # Calc. Time
-                        calc_time_text = cell_text(11)
+                        calc_time_text = texts[11]
                         # Rating (Chester Rating cell may have nested font/b)
-                        rating_text = cell_text(12) if len(cells) > 12 else ''
+                        rating_text = texts[12]
                         # Trainer (anchor text)
-                        trainer_text = cell_text(13) if len(cells) > 13 else ''
-                        results.append({
-                            'Date': date_text,
-                            'Track': track_text,
-                            'Dog': dog_text,
-                            'Trap': trap,
-                            'Grade': grade_text,
-                            'Distance': distance_text,
-                            'SP': sp_text,
-                            'Finish': finish_text,
-                            'Sectional': sectional_text,
-                            'Time': time_text,
-                            'Going': going_text,
-                            'Calc_Time': calc_time_text,
-                            'Rating': rating_text,
-                            'Trainer': trainer_text,
-                        })
+                        trainer_text = texts[13]
+                        results.append((
+                            date_text, track_text, dog_text, trap, grade_text,
+                            distance_text, sp_text, finish_text, sectional_text,
+                            time_text, going_text, calc_time_text, rating_text,
+                            trainer_text,
+                        ))
                     except Exception:
                         continue
-                # Stop after first matching table
-                if results:
-                    break
         return results
 
-    def _extract_race_history(self, soup, dog_name, track_name=None):
+    def _extract_race_history(self, table, dog_name, track_name=None):
         """
-        Extract the detailed race history table.
+        Extract the detailed race history rows from a pre-classified table.
         """
         races = []
-        
+
         try:
-            import re
-            # Find the main race results table
-            tables = soup.find_all('table')
-            
-            for table in tables:
-                # Look for the race history table (has Date, Track, Trap, etc. columns)
-                headers = table.find_all('th') if table.find('th') else []
-                if not headers:
-                    # Sometimes headers are in the first tr as td elements
-                    first_row = table.find('tr')
-                    if first_row:
-                        headers = first_row.find_all('td')
-                
-                if headers:
-                    header_text = [h.get_text().strip() for h in headers]
-                    # Check if this looks like the race history table
-                    if 'Date' in header_text and 'Track' in header_text and 'Grade' in header_text:
-                        # Found the race history table
-                        rows = table.find_all('tr')[1:]  # Skip header row
-                        
-                        for row in rows:
-                            cells = row.find_all('td')
-                            if len(cells) >= 10:  # Ensure we have enough columns
-                                try:
-                                    race_data = self._extract_race_data_from_row(cells, dog_name, track_name)
-                                    if race_data:
-                                        races.append(race_data)
-                                except Exception as e:
-                                    continue  # Skip problematic rows silently
-                        break
-                        
+            rows = table.find_all('tr')[1:] if table is not None else []  # Skip header row
+            for row in rows:
+                cells = row.find_all('td')
+                if len(cells) >= 10:  # Ensure we have enough columns
+                    try:
+                        race_data = self._extract_race_data_from_row(cells, dog_name, track_name)
+                        if race_data:
+                            races.append(race_data)
+                    except Exception:
+                        continue  # Skip problematic rows silently
+
         except Exception as e:
-            print(f"Error extracting race history: {e}")
-        
+            logger.error("Error extracting race history: %s", e)
+
         return races
 
     def _extract_race_data_from_row(self, cells, dog_name, track_name=None):
@@ -487,54 +946,65 @@ class DogStatsExtractor:
         Extract race data from a table row.
         """
         try:
-            import re
+            # One traversal per row: strip happens inside BeautifulSoup's
+            # get_text path instead of a second Python-level .strip() call
+            texts = [c.get_text(strip=True) for c in cells[:12]]
+            texts.extend([''] * (12 - len(texts)))
+
             # Skip AVERAGE row
-            if cells[0].get_text().strip() == 'AVERAGE':
+            if texts[0] == 'AVERAGE':
                 return None
-            
+
             # Extract trap number from image source
             trap_number = 'N/A'
             if len(cells) > 2:
                 trap_cell = cells[2]
                 img_tag = trap_cell.find('img')
                 if img_tag and img_tag.get('src'):
-                    src = img_tag.get('src')
-                    # Extract number from './images/trap_1.jpg' format
-                    trap_match = re.search(r'trap_(\d+)\.', src)
+                    trap_match = _TRAP_IMG_RE.search(img_tag.get('src'))
                     if trap_match:
                         trap_number = trap_match.group(1)
-            
+
             race_data = {
                 'dog_name': dog_name,
                 'track': track_name or 'All Tracks',
-                'date': cells[0].get_text().strip() if len(cells) > 0 else '',
-                'track_name': cells[1].get_text().strip() if len(cells) > 1 else '',
+                'date': texts[0],
+                'track_name': texts[1],
                 'trap': trap_number,
-                'grade': cells[3].get_text().strip() if len(cells) > 3 else '',
-                'distance': cells[4].get_text().strip() if len(cells) > 4 else '',
-                'going': cells[5].get_text().strip() if len(cells) > 5 else '',
-                'runners': cells[6].get_text().strip() if len(cells) > 6 else '',
-                'position': cells[7].get_text().strip() if len(cells) > 7 else '',
-                'btn': cells[8].get_text().strip() if len(cells) > 8 else '',
-                'time': cells[9].get_text().strip() if len(cells) > 9 else '',
-                'sp': cells[10].get_text().strip() if len(cells) > 10 else '',
-                'comment': cells[11].get_text().strip() if len(cells) > 11 else ''
+                'grade': texts[3],
+                'distance': texts[4],
+                'going': texts[5],
+                'runners': texts[6],
+                'position': texts[7],
+                'btn': texts[8],
+                'time': texts[9],
+                'sp': texts[10],
+                'comment': texts[11]
             }
-            
+
             return race_data
             
         except Exception as e:
-            print(f"Error extracting race data from row: {e}")
+            logger.error("Error extracting race data from row: %s", e)
             return None
 
 
+def extract_dog_statistics_async(dog_names: Iterable[str], concurrency: int = 16) -> pd.DataFrame:
+    """Sync shim running the async extractor for a list of dog names."""
+    extractor = DogStatsExtractor()
+    return asyncio.run(extractor.extract_dog_stats_async(dog_names, concurrency=concurrency))
+
+
 def extract_dog_statistics(race_data: pd.DataFrame) -> pd.DataFrame:
     """
     Main function to extract dog statistics.
-    
+
+    Uses the bounded-concurrency asyncio path when aiohttp is available,
+    falling back to the threaded extractor otherwise.
+
     Args:
         race_data: DataFrame containing race card data
-        
+
     Returns:
         DataFrame with dog statistics
     """
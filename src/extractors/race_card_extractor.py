@@ -7,6 +7,7 @@ from __future__ import annotations
 import time
 import os
 import re
+from collections import Counter, deque
 from datetime import datetime
 from typing import List, Dict, Optional
 try:
@@ -18,6 +19,8 @@ importing this module in environments without those packages for light tests."""
 
 # Defer heavy imports to runtime in methods
 BeautifulSoup = None  # type: ignore
+SoupStrainer = None  # type: ignore
+_BS_PARSER = None  # resolved alongside BeautifulSoup: lxml if available
 webdriver = None  # type: ignore
 Service = None  # type: ignore
 Options = None  # type: ignore
@@ -25,11 +28,78 @@ By = None  # type: ignore
 WebDriverWait = None  # type: ignore
 EC = None  # type: ignore
 ChromeDriverManager = None  # type: ignore
+TimeoutException = None  # type: ignore
+WebDriverException = None  # type: ignore
 
 # Utilities imported lazily where needed
 # from ..utils.browser_utils import setup_chrome_options, smart_cache_bust
 # from ..utils.file_utils import save_to_csv
 
+from ..utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+# Patterns applied per runner / per page, compiled once at import
+_MW_RE = re.compile(r'\s*\([MW]\)\s*')
+# Anchored to class-token boundaries so e.g. 'strap5' can never match
+_TRAP_CLASS_RE = re.compile(r'(?:^|\s)trap(\d+)(?=\s|$)')
+_RACE_NUM_RE = re.compile(r'Race\s+(\d+)')
+_FORM_RE = re.compile(r'Form:\s*([A-Z0-9T]+)')
+_FORECAST_RE = re.compile(r'SP Forecast:\s*([0-9/]+)')
+_TNR_RE = re.compile(r'Tnr:\s*([A-Za-z\s]+?)\s*(?:Form:|SP Forecast:|$)')
+_TRAINER_RE = re.compile(r'(?:Trainer:|T:)\s*(.+)$')
+# One fused scan fills grade and distance together: group 1 is a
+# parenthesised grade, group 2 a bare grade token, groups 3+4 a distance
+_GRADE_DIST_RE = re.compile(r'\(([A-Z]\d{1,2})\)|\b([A-Z]\d{1,2})\b|\b(\d{2,4})\s*(m|M|yds?|YDS?|y)\b')
+_DIST_FALLBACK_RE = re.compile(r'(\d{2,4})\s*m\b', re.IGNORECASE)
+_TIME_RE = re.compile(r'^\d{1,2}:\d{2}$')
+_RTIME_PARAM_RE = re.compile(r'[#&?]r_time=([^&#]+)')
+_RDATE_RE = re.compile(r'r_date=(\d{4}-\d{2}-\d{2})')
+
+# Fixed output schema: rows are built in this order everywhere, so the
+# DataFrame constructor skips per-column key scanning and type inference
+_CARD_COLUMNS = (
+    'Track', 'Race_Number', 'Race_Time', 'Grade', 'Distance',
+    'Trap', 'Dog_Name', 'Form', 'SP_Forecast', 'Trainer',
+)
+_CARD_CATEGORY_COLUMNS = ('Track', 'Grade', 'Distance', 'Trap', 'Trainer')
+
+# Subtree selectors shared by the in-page probe and the extractors:
+# everything each extractor reads, and nothing else
+_RESULT_SUBTREE_CSS = (
+    'h3#pagerResultTime, span#circle-race-title,'
+    ' span#title-circle-container, div.container'
+)
+_CARD_SUBTREE_CSS = 'span#circle-race-title, span#title-circle-container, #sortContainer'
+_RESULTS_MARKER_CSS = (
+    'div.result-dog-name-details, div.container a.details, a[href*="results-dog"]'
+)
+_READY_CSS = '#sortContainer, div.container a.details'
+
+# Runs in-browser via execute_async_script: poll for content, classify the
+# page and return its relevant subtree HTML in a single WebDriver round-trip
+_PROBE_SCRIPT = """
+var done = arguments[arguments.length - 1];
+var deadline = Date.now() + arguments[0];
+var readySel = arguments[1], markerSel = arguments[2];
+var resultSel = arguments[3], cardSel = arguments[4];
+function subtree(sel) {
+    return Array.from(document.querySelectorAll(sel),
+                      function(e){return e.outerHTML;}).join('');
+}
+function check() {
+    var ready = !!document.querySelector(readySel);
+    if (ready || Date.now() > deadline) {
+        var results = !!document.querySelector(markerSel);
+        done({ready: ready, results: results,
+              html: subtree(results ? resultSel : cardSel)});
+    } else {
+        setTimeout(check, 100);
+    }
+}
+check();
+"""
+
 
 class RaceCardExtractor:
     """Main class for extracting race card data from Racing Post.
@@ -39,24 +109,44 @@ class RaceCardExtractor:
       - Historical: scrape past race results/cards for a given date or date range
     """
     
+    # How many race cards load concurrently in background tabs, and the
+    # minimum spacing between tab opens (per-domain pacing, ~4 req/s max)
+    _TAB_BATCH = 4
+    _NAV_INTERVAL = 0.25
+
+    # How many recently-extracted dog names the duplicate detector remembers
+    _DUP_WINDOW = 6
+
+    # Resolved chromedriver path, shared across instances so the (possibly
+    # network-bound) webdriver-manager lookup runs at most once per process
+    _driver_path: Optional[str] = None
+
     def __init__(self, base_url: str = "https://greyhoundbet.racingpost.com/"):
         self.base_url = base_url.rstrip("/") + "/"
         self.driver = None
+        self._service = None
+        # Try plain HTTP for the meetings index before rendering it in Chrome
+        self._use_http = True
+        # Rolling window of recent dog names for cache-staleness detection
+        self._recent_names: deque = deque()
+        self._recent_counts: Counter = Counter()
         
     def extract_race_data(
         self,
         mode: str = "today",
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
+        force_rescrape: bool = False,
     ) -> Optional[object]:
         """
         Extract race data.
-        
+
         Args:
             mode: "today" or "historical"
             start_date: inclusive start date (YYYY-MM-DD) for historical mode; if None and mode==historical, uses end_date
             end_date: inclusive end date (YYYY-MM-DD) for historical mode; if None and mode==historical, uses start_date
-        
+            force_rescrape: bypass the on-disk race cache and re-fetch every card
+
         Returns:
             DataFrame with race data or None if extraction fails
         """
@@ -71,43 +161,113 @@ class RaceCardExtractor:
                     end_date = start_date
                 if end_date and not start_date:
                     start_date = end_date
-                print(f"Loading Racing Post historical results from {start_date} to {end_date}...")
-                all_race_data: List[Dict] = []
-                for date_str in self._iter_dates_inclusive(start_date, end_date):
-                    day_data = self._extract_for_single_date(date_str)
-                    all_race_data.extend(day_data)
+                logger.info("Loading Racing Post historical results from %s to %s...", start_date, end_date)
                 if pd is None:
                     raise ImportError("pandas is required to build the output DataFrame. Install requirements.txt")
-                df = pd.DataFrame(all_race_data)
-                print(f"Extracted {len(df)} race entries across {len(list(self._iter_dates_inclusive(start_date, end_date)))} day(s)")
+                import csv
+                from ..utils.config import config
+                all_race_data: List[Dict] = []
+                dates = list(self._iter_dates_inclusive(start_date, end_date))
+
+                # Completed days stream to an on-disk progress log so an
+                # interrupted multi-day backfill resumes where it stopped
+                # instead of rescraping from the start
+                progress_path = config.CACHE_DIR / "race_cards_progress.csv"
+                done_dates = set()
+                if progress_path.exists():
+                    try:
+                        prior = pd.read_csv(progress_path, dtype=str, keep_default_na=False)
+                        done_dates = set(prior['R_Date'].unique())
+                        resumed = prior[list(_CARD_COLUMNS)].to_dict('records')
+                        for row in resumed:
+                            if row['Trap'].isdigit():
+                                row['Trap'] = int(row['Trap'])
+                        all_race_data.extend(resumed)
+                        logger.info("Resuming: %d day(s) already completed in %s", len(done_dates), progress_path.name)
+                    except Exception as e:
+                        logger.warning("Could not resume from %s: %s", progress_path.name, e)
+
+                progress_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(progress_path, 'a', newline='', encoding='utf-8') as progress_file:
+                    writer = csv.writer(progress_file)
+                    if progress_file.tell() == 0:
+                        writer.writerow(('R_Date',) + _CARD_COLUMNS)
+                    for date_str in dates:
+                        if date_str in done_dates:
+                            continue
+                        day_data = self._extract_for_single_date(date_str, force_rescrape=force_rescrape)
+                        all_race_data.extend(day_data)
+                        writer.writerows(
+                            [date_str] + [row[col] for col in _CARD_COLUMNS]
+                            for row in day_data
+                        )
+                        progress_file.flush()
+
+                df = self._build_card_frame(all_race_data)
+                logger.info("Extracted %d race entries across %d day(s)", len(df), len(dates))
+                # Backfill finished: the progress log has served its purpose
+                try:
+                    progress_path.unlink()
+                except OSError:
+                    pass
                 return df
 
             # Default: today's races
-            print("Loading Racing Post website (today's races)...")
-            self.driver.get(self.base_url)
-            time.sleep(2)
-            
+            logger.info("Loading Racing Post website (today's races)...")
+            index_html = self._fetch_index_html() if self._use_http else None
+            if index_html is None:
+                self.driver.get(self.base_url)
+                self._wait_for('a[href*="meeting-races"]')
+
             # Extract race card URLs
-            race_card_urls = self._extract_race_card_urls()
+            race_card_urls = self._extract_race_card_urls(index_html)
             
             # Extract detailed race information
-            all_race_data = self._extract_from_race_cards(race_card_urls)
+            all_race_data = self._extract_from_race_cards(race_card_urls, force_rescrape=force_rescrape)
             
             # Create DataFrame
             if pd is None:
                 raise ImportError("pandas is required to build the output DataFrame. Install requirements.txt")
-            df = pd.DataFrame(all_race_data)
-            print(f"Extracted {len(df)} race entries")
+            df = self._build_card_frame(all_race_data)
+            logger.info("Extracted %d race entries", len(df))
             return df
             
         except Exception as e:
-            print(f"Error during race card extraction: {e}")
+            logger.error("Error during race card extraction: %s", e)
             return None
-            
-        finally:
-            if self.driver:
+
+    @staticmethod
+    def _build_card_frame(all_race_data: List[Dict]):
+        """Build the output DataFrame with a fixed schema and compact dtypes.
+
+        Passing the column order up front skips pandas' per-row key scan, and
+        the repeated site vocabulary (tracks, grades, distances, traps,
+        trainers) interns cheaply as category columns. Race_Number/Race_Time/
+        Dog_Name/Form/SP_Forecast stay as text for downstream parsing.
+        """
+        df = pd.DataFrame.from_records(all_race_data, columns=list(_CARD_COLUMNS))
+        if len(df):
+            df = df.astype({col: 'category' for col in _CARD_CATEGORY_COLUMNS})
+        return df
+
+    def close(self) -> None:
+        """Quit the browser and release the driver service.
+
+        The driver is kept warm between extract_race_data() calls so repeat
+        runs skip Chrome start-up; callers own the lifetime via close().
+        """
+        if self.driver:
+            try:
                 self.driver.quit()
-                print("Browser closed")
+            finally:
+                self.driver = None
+                logger.info("Browser closed")
+
+    def __enter__(self) -> "RaceCardExtractor":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
     # ---------------- Historical helpers ----------------
     def _iter_dates_inclusive(self, start_date: str, end_date: str):
@@ -121,50 +281,77 @@ class RaceCardExtractor:
             yield cur.strftime("%Y-%m-%d")
             cur += timedelta(days=1)
 
-    def _extract_for_single_date(self, date_str: str) -> List[Dict]:
+    def _extract_for_single_date(self, date_str: str, force_rescrape: bool = False) -> List[Dict]:
         """Extract all races for a specific historical date."""
         try:
             results_url = f"{self.base_url}#results-list/r_date={date_str}"
-            print(f"Navigating to results page: {results_url}")
+            logger.info("Navigating to results page: %s", results_url)
             self.driver.get(results_url)
-            time.sleep(2)
             # Wait up to ~12s for meeting links to render in SPA
-            try:
-                WebDriverWait(self.driver, 12).until(
-                    lambda d: len(d.find_elements(
-                        By.CSS_SELECTOR,
-                        'a.results-race-name[href*="#result-meeting/"]'
-                    )) > 0
-                )
-            except Exception:
-                pass
+            self._wait_for('a.results-race-name[href*="#result-meeting/"]', timeout=12)
 
             meeting_links = self._extract_results_meeting_links()
-            print(f"Found {len(meeting_links)} results meetings for {date_str}")
+            logger.info("Found %d results meetings for %s", len(meeting_links), date_str)
 
             race_card_urls: List[Dict] = []
-            for meeting in meeting_links:
-                try:
-                    print(f"Processing results meeting: {meeting['track']}")
-                    self.driver.get(meeting['url'])
-                    time.sleep(2)
-                    race_urls = self._extract_race_urls_from_results_meeting(meeting['track'])
-                    race_card_urls.extend(race_urls)
-                except Exception as e:
-                    print(f"Error processing results meeting {meeting.get('track','?')}: {e}")
-                    continue
+            targets = [(meeting['url'], meeting['track']) for meeting in meeting_links]
+            for start in range(0, len(targets), self._TAB_BATCH):
+                main_handle, opened = self._open_tabs(targets[start:start + self._TAB_BATCH])
+                for handle, track, _ in opened:
+                    try:
+                        logger.info("Processing results meeting: %s", track)
+                        self.driver.switch_to.window(handle)
+                        race_card_urls.extend(self._extract_race_urls_from_results_meeting(track))
+                    except Exception as e:
+                        logger.warning("Error processing results meeting %s: %s", track, e)
+                    finally:
+                        try:
+                            self.driver.close()
+                        except Exception:
+                            pass
+                self.driver.switch_to.window(main_handle)
 
-            print(f"Found {len(race_card_urls)} race cards for {date_str}")
-            return self._extract_from_race_cards(race_card_urls)
+            logger.info("Found %d race cards for %s", len(race_card_urls), date_str)
+            return self._extract_from_race_cards(race_card_urls, force_rescrape=force_rescrape)
         except Exception as e:
-            print(f"Error extracting for date {date_str}: {e}")
+            logger.error("Error extracting for date %s: %s", date_str, e)
             return []
     
     def _setup_driver(self):
-        """Setup Chrome driver with optimized options."""
+        """Setup Chrome driver with optimized options, reusing a warm browser."""
+        if self.driver is not None:
+            return
         self._lazy_imports()
         from ..utils.browser_utils import setup_chrome_options
         chrome_options = setup_chrome_options()
+        if self._service is None:
+            self._service = Service(self._resolve_driver_path())
+        self.driver = webdriver.Chrome(service=self._service, options=chrome_options)
+
+        # Disable automation detection
+        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+
+        # Block static assets the extractors never read - only the rendered
+        # HTML matters, so images/fonts/styles/media are wasted bytes -
+        # along with third-party analytics beacons that just add requests
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {
+                'urls': ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp',
+                         '*.svg', '*.ico', '*.woff*', '*.ttf', '*.css',
+                         '*.mp4', '*.webm',
+                         '*google-analytics.com*', '*googletagmanager.com*',
+                         '*doubleclick.net*', '*facebook.net*',
+                         '*hotjar.com*'],
+            })
+        except Exception as e:
+            logger.warning("CDP asset blocking unavailable: %s", e)
+
+    @classmethod
+    def _resolve_driver_path(cls) -> str:
+        """Locate chromedriver once and memoize the path for the process."""
+        if cls._driver_path and os.path.exists(cls._driver_path):
+            return cls._driver_path
         # Prefer system-installed chromedriver (e.g., from apt) with optional CHROMEDRIVER override
         driver_path = os.environ.get("CHROMEDRIVER")
         if not driver_path:
@@ -175,57 +362,144 @@ class RaceCardExtractor:
                 if os.path.exists(p):
                     driver_path = p
                     break
-        if driver_path and os.path.exists(driver_path):
-            service = Service(driver_path)
-        else:
-            # Fallback to webdriver-manager auto install
-            service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
-
-        # Disable automation detection
-        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        if not (driver_path and os.path.exists(driver_path)):
+            # Fallback to webdriver-manager auto install (network lookup)
+            driver_path = ChromeDriverManager().install()
+        cls._driver_path = driver_path
+        return driver_path
     
-    def _extract_race_card_urls(self) -> List[Dict]:
+    def _retry_transient(self, fn, tries: int = 3, base: float = 1.0):
+        """Run fn, retrying transient WebDriver failures with exponential backoff.
+
+        Timeouts and driver hiccups (lost connection, stale window) used to
+        drop the race outright; they now get up to `tries` attempts spaced
+        base * 2**attempt seconds apart. The last failure propagates.
+        """
+        for attempt in range(tries):
+            try:
+                return fn()
+            except (TimeoutException, WebDriverException) as e:
+                if attempt == tries - 1:
+                    raise
+                delay = base * (2 ** attempt)
+                logger.warning(
+                    "Transient WebDriver error (%s); retrying in %.1fs",
+                    e.__class__.__name__, delay,
+                )
+                time.sleep(delay)
+
+    def _subtree_html(self, css_selector: str) -> str:
+        """Return the concatenated outerHTML of elements matching css_selector.
+
+        page_source serialises the whole DOM across the WebDriver wire;
+        shipping only the subtrees a parser actually reads cuts the bytes
+        moved per page by an order of magnitude on asset-heavy pages.
+        """
+        try:
+            return self.driver.execute_script(
+                "return Array.from(document.querySelectorAll(arguments[0]),"
+                " function(e){return e.outerHTML;}).join('');",
+                css_selector,
+            )
+        except Exception:
+            return ''
+
+    def _wait_for(self, css_selector: str, timeout: float = 10) -> bool:
+        """Wait until an element matching css_selector renders, up to timeout.
+
+        Returns True as soon as the element appears, so fast page loads cost
+        only the 0.1s poll interval instead of a fixed sleep budget.
+        """
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
+                lambda d: d.find_elements(By.CSS_SELECTOR, css_selector)
+            )
+            return True
+        except Exception:
+            return False
+
+    def _fetch_index_html(self) -> Optional[str]:
+        """Fetch the meetings index over plain HTTP, skipping a Chrome render.
+
+        The homepage is the one view not behind a fragment route, so when it
+        is served server-rendered a simple GET replaces a full page load. If
+        the response carries no meeting links (client-rendered variant), the
+        caller falls back to a browser navigation.
+        """
+        try:
+            import requests
+        except Exception:  # pragma: no cover
+            return None
+        try:
+            response = requests.get(
+                self.base_url,
+                timeout=15,
+                headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'},
+            )
+            response.raise_for_status()
+        except Exception as e:
+            logger.info("HTTP index fetch failed, falling back to browser: %s", e)
+            return None
+        if 'meeting-races' not in response.text:
+            logger.info("Meetings index not server-rendered, falling back to browser")
+            return None
+        return response.text
+
+    def _extract_race_card_urls(self, index_html: Optional[str] = None) -> List[Dict]:
         """Extract all race card URLs from meetings."""
         race_card_urls: List[Dict] = []
-        self._ensure_bs4()
-        soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-        meeting_links = soup.find_all('a', href=lambda x: x and 'meeting-races' in x)
-        print(f"Found {len(meeting_links)} meetings")
+        if index_html:
+            # Full homepage from the HTTP fetch: only its anchors matter here
+            soup = self._parse(index_html, anchors_only=True)
+        else:
+            soup = self._parse(self._subtree_html('a[href*="meeting-races"]'))
+        meeting_links = soup.select('a[href*="meeting-races"]')
+        logger.info("Found %d meetings", len(meeting_links))
         processed_meetings = set()
+        seen_hrefs = set()
+        targets: List[tuple] = []
         for meeting_link in meeting_links:
-            try:
-                track_element = meeting_link.find('h4')
-                if not track_element:
-                    continue
-                track_name = track_element.get_text().strip().split('\n')[0].strip()
-                if track_name in processed_meetings:
-                    continue
-                processed_meetings.add(track_name)
-                print(f"Processing meeting: {track_name}")
-                meeting_href = meeting_link.get('href', '')
-                if meeting_href:
-                    full_url = f"{self.base_url}{meeting_href}"
-                    self.driver.get(full_url)
-                    time.sleep(2)
-                    meeting_race_urls = self._extract_race_urls_from_meeting(track_name)
-                    race_card_urls.extend(meeting_race_urls)
-            except Exception as e:
-                print(f"Error processing meeting {track_name}: {e}")
+            # Cheap href dedupe first: repeat anchors for the same meeting
+            # are skipped before any subtree walk for the track name
+            meeting_href = meeting_link.get('href', '')
+            if not meeting_href or meeting_href in seen_hrefs:
                 continue
-        print(f"Found {len(race_card_urls)} total race cards")
+            seen_hrefs.add(meeting_href)
+            track_element = meeting_link.find('h4')
+            if not track_element:
+                continue
+            track_name = track_element.get_text().strip().split('\n')[0].strip()
+            if track_name in processed_meetings:
+                continue
+            processed_meetings.add(track_name)
+            targets.append((f"{self.base_url}{meeting_href}", track_name))
+
+        # Meeting pages load concurrently in background tab batches
+        for start in range(0, len(targets), self._TAB_BATCH):
+            main_handle, opened = self._open_tabs(targets[start:start + self._TAB_BATCH])
+            for handle, track_name, _ in opened:
+                try:
+                    logger.info("Processing meeting: %s", track_name)
+                    self.driver.switch_to.window(handle)
+                    self._wait_for('a[href*="#card/"]')
+                    race_card_urls.extend(self._extract_race_urls_from_meeting(track_name))
+                except Exception as e:
+                    logger.warning("Error processing meeting %s: %s", track_name, e)
+                finally:
+                    try:
+                        self.driver.close()
+                    except Exception:
+                        pass
+            self.driver.switch_to.window(main_handle)
+        logger.info("Found %d total race cards", len(race_card_urls))
         return race_card_urls
 
     def _extract_results_meeting_links(self) -> List[Dict]:
         """Extract meeting links from a results list page for a specific date."""
         links: List[Dict] = []
-        self._ensure_bs4()
-        soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+        soup = self._parse(self._subtree_html('a[href*="#result-meeting/"]'))
         # Example: <a class="results-race-name" href="#result-meeting/track_id=5&r_date=YYYY-MM-DD&r_time=HH:MM">Hove</a>
-        meeting_anchors = soup.find_all(
-            'a',
-            href=lambda x: x and ('#result-meeting/' in x)
-        )
+        meeting_anchors = soup.select('a[href*="#result-meeting/"]')
         processed = set()
         for a in meeting_anchors:
             try:
@@ -244,9 +518,8 @@ class RaceCardExtractor:
     def _extract_race_urls_from_meeting(self, track_name: str) -> List[Dict]:
         """Extract race URLs from current meeting page."""
         race_urls: List[Dict] = []
-        self._ensure_bs4()
-        soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-        race_links = soup.find_all('a', href=lambda x: x and '#card/' in x)
+        soup = self._parse(self._subtree_html('a[href*="#card/"]'))
+        race_links = soup.select('a[href*="#card/"]')
         for race_link in race_links:
             href = race_link.get('href', '')
             if href:
@@ -258,25 +531,19 @@ class RaceCardExtractor:
                         'race_time': race_info.get('time', 'TBC'),
                         'race_number': race_info.get('number', 'TBC')
                     })
-        print(f"Found {len(race_urls)} races for {track_name}")
+        logger.info("Found %d races for %s", len(race_urls), track_name)
         return race_urls
 
     def _extract_race_urls_from_results_meeting(self, track_name: str) -> List[Dict]:
         """Extract race URLs from a results meeting page."""
         race_urls: List[Dict] = []
         # Wait for race links to load (result/card/race anchors)
-        try:
-            WebDriverWait(self.driver, 12).until(
-                lambda d: len(d.find_elements(
-                    By.CSS_SELECTOR,
-                    'a[href*="#result-meeting-result/"], a[href*="#card/"]'
-                )) > 0
-            )
-        except Exception:
-            pass
-        soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+        self._wait_for('a[href*="#result-meeting-result/"], a[href*="#card/"]', timeout=12)
+        soup = self._parse(
+            self._subtree_html('a[href*="#result-meeting-result/"], a[href*="#card/"]')
+        )
         # Example race anchor: <a href="#result-meeting-result/race_id=...&track_id=...&r_date=YYYY-MM-DD&r_time=HH:MM">11:01</a>
-        race_links = soup.find_all('a', href=lambda x: x and ('#result-meeting-result/' in x or '#card/' in x))
+        race_links = soup.select('a[href*="#result-meeting-result/"], a[href*="#card/"]')
         for race_link in race_links:
             href = race_link.get('href', '')
             if not href:
@@ -294,23 +561,27 @@ class RaceCardExtractor:
                 'race_time': info.get('time', 'TBC') if info else 'TBC',
                 'race_number': info.get('number', 'TBC') if info else 'TBC',
             })
-        print(f"Found {len(race_urls)} races for {track_name} (results)")
+        logger.info("Found %d races for %s (results)", len(race_urls), track_name)
         return race_urls
     
     def _extract_race_info_from_link(self, race_link) -> Optional[Dict]:
-        """Extract race time and number from race link."""
+        """Extract race time and number from race link in a single traversal."""
         try:
-            time_element = race_link.find('strong')
-            race_time = time_element.get_text().strip() if time_element else 'TBC'
-            
-            race_number_element = race_link.find('h4')
+            race_time = 'TBC'
             race_number = 'TBC'
-            if race_number_element:
-                race_text = race_number_element.get_text().strip()
-                race_match = re.search(r'Race (\d+)', race_text)
-                if race_match:
-                    race_number = race_match.group(1)
-            
+            seen_strong = seen_h4 = False
+            for el in race_link.find_all(['strong', 'h4']):
+                if el.name == 'strong' and not seen_strong:
+                    seen_strong = True
+                    race_time = el.get_text().strip()
+                elif el.name == 'h4' and not seen_h4:
+                    seen_h4 = True
+                    race_match = _RACE_NUM_RE.search(el.get_text().strip())
+                    if race_match:
+                        race_number = race_match.group(1)
+                if seen_strong and seen_h4:
+                    break
+
             return {
                 'time': race_time,
                 'number': race_number
@@ -318,89 +589,177 @@ class RaceCardExtractor:
         except:
             return None
     
-    def _extract_from_race_cards(self, race_card_urls: List[Dict]) -> List[Dict]:
-        """Extract runners from individual race cards with smart cache handling."""
+    def _extract_from_race_cards(self, race_card_urls: List[Dict], force_rescrape: bool = False) -> List[Dict]:
+        """Extract runners from individual race cards with smart cache handling.
+
+        Race cards load in batches of background tabs so the SPA renders
+        several pages concurrently; each tab is then parsed in turn. Tab
+        opens are spaced by _NAV_INTERVAL to stay polite to the site.
+        """
         from ..utils.browser_utils import smart_cache_bust
+        from ..utils import race_cache
         self._lazy_imports()
         all_race_data: List[Dict] = []
         current_track = None
         cache_bust_counter = 0
+        self._recent_names.clear()
+        self._recent_counts.clear()
 
-        print(f"Processing {len(race_card_urls)} race cards...")
-        
-        for i, race_info in enumerate(race_card_urls):
-            try:
-                print(f"Processing race {i+1}/{len(race_card_urls)}: {race_info['track']} Race {race_info['race_number']}")
-                
-                # Smart cache busting
-                if current_track != race_info['track']:
-                    print(f"    Switching to new track: {race_info['track']}")
-                    smart_cache_bust(self.driver, force_aggressive=True)
-                    current_track = race_info['track']
-                    cache_bust_counter += 1
-                elif i % 8 == 0:
-                    smart_cache_bust(self.driver, force_aggressive=False)
-                    cache_bust_counter += 1
-                
-                # Navigate to race card
-                race_url = f"{self.base_url}{race_info['url']}"
-                if i % 5 == 0:
-                    race_url += f"?t={int(time.time())}"
-                
-                self.driver.get(race_url)
-                time.sleep(1.5)
-                
-                # Quick content verification - support both card and results pages
+        # Serve unchanged race cards straight from the on-disk cache.
+        # Settled results never change so they never expire; today's cards
+        # use the short TTL since runners can change up to off-time.
+        pending: List[Dict] = []
+        cache_hits = 0
+        for race_info in race_card_urls:
+            if force_rescrape:
+                pending.append(race_info)
+                continue
+            ttl = race_cache.TTL_RESULT if '#result-' in race_info['url'] else race_cache.TTL_TODAY
+            cached = race_cache.get(self._cache_key(race_info), ttl=ttl)
+            if cached is not None:
+                all_race_data.extend(cached)
+                cache_hits += 1
+            else:
+                pending.append(race_info)
+        if cache_hits:
+            logger.info("Loaded %d race cards from cache", cache_hits)
+
+        total = len(pending)
+        logger.info("Processing %d race cards in batches of %d...", total, self._TAB_BATCH)
+
+        for start in range(0, total, self._TAB_BATCH):
+            batch = pending[start:start + self._TAB_BATCH]
+            # Aggressive bust ahead of a track switch; fresh tabs make
+            # mid-batch switches safe, so only the batch boundary matters
+            if batch[0]['track'] != current_track:
+                logger.info("Switching to new track: %s", batch[0]['track'])
+                smart_cache_bust(self.driver, force_aggressive=True)
+                cache_bust_counter += 1
+            elif (start // self._TAB_BATCH) % 2 == 0:
+                smart_cache_bust(self.driver, force_aggressive=False)
+                cache_bust_counter += 1
+            current_track = batch[-1]['track']
+
+            main_handle, loaded = self._open_tab_batch(batch, start)
+            for i, (handle, race_info, race_url) in enumerate(loaded, start):
                 try:
-                    WebDriverWait(self.driver, 6).until(
-                        lambda d: d.find_elements(By.ID, "sortContainer") or 
-                                  d.find_elements(By.CSS_SELECTOR, "div.container a.details")
+                    logger.info("Processing race %d/%d: %s Race %s", i + 1, total, race_info['track'], race_info['race_number'])
+                    self.driver.switch_to.window(handle)
+                    runners = self._retry_transient(
+                        lambda: self._collect_loaded_race(race_info, race_url)
                     )
-                except:
-                    print(f"    Content not loaded, refreshing...")
-                    self.driver.refresh()
-                    time.sleep(2)
-                
-                # Decide extractor based on page content
-                self._ensure_bs4()
-                soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-                if self._is_results_page(soup) or '#result-' in race_url:
-                    runners = self._extract_runners_from_result_page(race_info)
-                else:
-                    runners = self._extract_runners_from_race_card(race_info)
-                
-                if runners:
-                    # Duplicate detection
-                    if self._check_for_duplicates(all_race_data, runners, race_url):
-                        runners = self._retry_with_cache_bust(race_info, race_url)
-                    
                     if runners:
                         all_race_data.extend(runners)
-                        print(f"    Extracted {len(runners)} runners")
-                    else:
-                        print(f"    Skipped race due to cache/duplicate issues")
-                else:
-                    print(f"    No runners found")
-                    
-            except Exception as e:
-                print(f"Error processing race {i+1}: {e}")
-                continue
-        
-        print(f"Cache busts performed: {cache_bust_counter}")
+                        self._note_recent_dogs(runners)
+                        race_cache.put(self._cache_key(race_info), runners)
+                        logger.info("Extracted %d runners", len(runners))
+                except Exception as e:
+                    logger.warning("Error processing race %d: %s", i + 1, e)
+                finally:
+                    try:
+                        self.driver.close()
+                    except Exception:
+                        pass
+            self.driver.switch_to.window(main_handle)
+
+        logger.info("Cache busts performed: %d", cache_bust_counter)
         return all_race_data
 
-    def _is_results_page(self, soup) -> bool:
-        """Detect if current page is a results page (not a card)."""
-        if soup.find('div', class_='result-dog-name-details'):
-            return True
-        if soup.select('div.container a.details'):
-            return True
-        # Fallback: anchors starting with results-dog
-        if soup.find('a', href=lambda x: x and 'results-dog' in x):
-            return True
-        return False
+    def _cache_key(self, race_info: Dict) -> str:
+        """Cache key for a race card: its canonical URL plus the race date.
+
+        Historical URLs carry their own r_date; today's cards key on today so
+        entries naturally roll over at midnight.
+        """
+        from ..utils import race_cache
+        href = race_info['url']
+        m = _RDATE_RE.search(href)
+        date = m.group(1) if m else datetime.now().strftime("%Y-%m-%d")
+        return race_cache.make_key(href, date)
 
-    def _extract_runners_from_result_page(self, race_info: Dict) -> List[Dict]:
+    def _open_tabs(self, targets: List[tuple]) -> tuple:
+        """Open one background tab per (url, payload) target so loads overlap.
+
+        Tab opens are paced by _NAV_INTERVAL. Returns
+        (main_handle, [(handle, payload, url), ...]) for the tabs that
+        actually opened, in open order.
+        """
+        main_handle = self.driver.current_window_handle
+        known = set(self.driver.window_handles)
+        opened = []
+        for url, payload in targets:
+            self.driver.execute_script("window.open(arguments[0]);", url)
+            new_handles = [h for h in self.driver.window_handles if h not in known]
+            if new_handles:
+                known.add(new_handles[0])
+                opened.append((new_handles[0], payload, url))
+            time.sleep(self._NAV_INTERVAL)
+        return main_handle, opened
+
+    def _open_tab_batch(self, batch: List[Dict], start_index: int) -> tuple:
+        """Open one background tab per race so page loads overlap."""
+        targets = []
+        for offset, race_info in enumerate(batch):
+            race_url = f"{self.base_url}{race_info['url']}"
+            if (start_index + offset) % 5 == 0:
+                race_url += f"?t={int(time.time())}"
+            targets.append((race_url, race_info))
+        return self._open_tabs(targets)
+
+    def _collect_loaded_race(self, race_info: Dict, race_url: str) -> List[Dict]:
+        """Wait for an already-navigating tab to render, then extract its runners."""
+        # One round-trip waits for content, classifies the page and brings
+        # back its subtree HTML, instead of wait + classify + fetch calls
+        probe = self._probe_race_page(timeout=6)
+        if not probe['ready']:
+            # Re-GET with a cache buster instead of refresh(): a refresh
+            # reloads every page asset, a direct navigation reuses them
+            logger.info("Content not loaded, re-fetching with cache buster...")
+            self.driver.get(race_url + f"?_={time.time_ns()}")
+            probe = self._probe_race_page(timeout=5)
+
+        # Decide extractor based on page content; the probe's HTML matches
+        # its own classification, so when the URL overrides it we re-fetch
+        if probe['results']:
+            runners = self._extract_runners_from_result_page(race_info, html=probe['html'])
+        elif '#result-' in race_url:
+            runners = self._extract_runners_from_result_page(race_info)
+        else:
+            runners = self._extract_runners_from_race_card(race_info, html=probe['html'])
+
+        if runners:
+            # Duplicate detection
+            if self._check_for_duplicates(runners, race_url):
+                runners = self._retry_with_cache_bust(race_info, race_url)
+            if not runners:
+                logger.warning("Skipped race due to cache/duplicate issues")
+        else:
+            logger.info("No runners found")
+        return runners or []
+
+    def _probe_race_page(self, timeout: float = 6.0) -> Dict:
+        """Wait for race content, classify card vs results, grab its HTML.
+
+        All three happen inside one execute_async_script round-trip: the
+        in-page script polls for content, then returns {ready, results,
+        html} where html is the subtree the matching extractor will parse.
+        """
+        try:
+            probe = self.driver.execute_async_script(
+                _PROBE_SCRIPT,
+                int(timeout * 1000),
+                _READY_CSS,
+                _RESULTS_MARKER_CSS,
+                _RESULT_SUBTREE_CSS,
+                _CARD_SUBTREE_CSS,
+            )
+            if isinstance(probe, dict) and 'ready' in probe:
+                return probe
+        except Exception:
+            pass
+        return {'ready': False, 'results': False, 'html': ''}
+
+    def _extract_runners_from_result_page(self, race_info: Dict, html: Optional[str] = None) -> List[Dict]:
         """Extract runners from a historical results page.
         Expects DOM like:
           <div class="container">
@@ -411,8 +770,8 @@ class RaceCardExtractor:
         """
         runners: List[Dict] = []
         try:
-            self._ensure_bs4()
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+            # Only the pager time, race title and result containers are read
+            soup = self._parse(html or self._subtree_html(_RESULT_SUBTREE_CSS))
             # Ensure Race_Time is populated from results page controls
             try:
                 extracted_time = self._extract_time_from_results_page(soup)
@@ -425,26 +784,21 @@ class RaceCardExtractor:
             race_no = race_info.get('race_number', 'TBC')
             title_el = soup.select_one('span#circle-race-title')
             if title_el and (race_no == 'TBC' or not race_no):
-                m = re.search(r'Race\s+(\d+)', title_el.get_text(" ", strip=True))
+                m = _RACE_NUM_RE.search(title_el.get_text(" ", strip=True))
                 if m:
                     race_info['race_number'] = m.group(1)
 
             entries = soup.select('div.container a.details')
-            print(f"Found {len(entries)} result entries (Grade: {grade}, Distance: {distance})")
+            logger.info("Found %d result entries (Grade: %s, Distance: %s)", len(entries), grade, distance)
             for entry in entries:
                 try:
                     # Trap number from class 'bigTrap trapX'
                     trap_div = entry.select_one('div.bigTrap')
                     trap_number = 'TBC'
                     if trap_div:
-                        classes = trap_div.get('class', [])
-                        for cls in classes:
-                            if cls.startswith('trap') and len(cls) > 4:
-                                try:
-                                    trap_number = int(cls.replace('trap', ''))
-                                    break
-                                except Exception:
-                                    pass
+                        m = _TRAP_CLASS_RE.search(' '.join(trap_div.get('class', [])))
+                        if m:
+                            trap_number = int(m.group(1))
 
                     # Dog name
                     name_el = entry.select_one('div.result-dog-name-details div.name')
@@ -459,7 +813,7 @@ class RaceCardExtractor:
                     tr_el = entry.select_one('div.cols.dog-cols div.col.col3')
                     if tr_el:
                         txt = tr_el.get_text(" ", strip=True)
-                        m = re.search(r"(?:Trainer:|T:)\s*(.+)$", txt)
+                        m = _TRAINER_RE.search(txt)
                         if m:
                             trainer = m.group(1).strip()
                         else:
@@ -481,10 +835,10 @@ class RaceCardExtractor:
                         'Trainer': trainer,
                     })
                 except Exception as e:
-                    print(f"Error processing result entry: {e}")
+                    logger.warning("Error processing result entry: %s", e)
                     continue
         except Exception as e:
-            print(f"Error extracting results runners: {e}")
+            logger.error("Error extracting results runners: %s", e)
         return runners
 
     def _extract_time_from_results_page(self, soup) -> Optional[str]:
@@ -495,38 +849,38 @@ class RaceCardExtractor:
         time_el = soup.select_one('h3#pagerResultTime')
         if time_el:
             text = time_el.get_text(strip=True)
-            if re.match(r"^\d{1,2}:\d{2}$", text):
+            if _TIME_RE.match(text):
                 return text
         # Fallback: r_time param in URL fragment (might be percent-encoded)
         try:
             from urllib.parse import unquote
             url = self.driver.current_url
             # Look for r_time=HH%3AMM or HH:MM
-            m = re.search(r"[#&?]r_time=([^&#]+)", url)
+            m = _RTIME_PARAM_RE.search(url)
             if m:
                 val = unquote(m.group(1))
                 # Validate format
-                if re.match(r"^\d{1,2}:\d{2}$", val):
+                if _TIME_RE.match(val):
                     return val
         except Exception:
             pass
         return None
     
-    def _extract_runners_from_race_card(self, race_info: Dict) -> List[Dict]:
+    def _extract_runners_from_race_card(self, race_info: Dict, html: Optional[str] = None) -> List[Dict]:
         """Extract all runners from a race card page."""
         runners = []
-        
+
         try:
-            self._ensure_bs4()
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+            # Only the title block (grade/distance) and runner list are read
+            soup = self._parse(html or self._subtree_html(_CARD_SUBTREE_CSS))
             grade, distance = self._extract_race_grade_and_distance(soup)
-            
+
             sort_container = soup.find('div', id='sortContainer')
             if not sort_container:
                 return runners
             
             runner_blocks = sort_container.find_all('div', class_='runnerBlock')
-            print(f"Found {len(runner_blocks)} runners (Grade: {grade}, Distance: {distance})")
+            logger.info("Found %d runners (Grade: %s, Distance: %s)", len(runner_blocks), grade, distance)
             
             for runner_block in runner_blocks:
                 try:
@@ -534,17 +888,18 @@ class RaceCardExtractor:
                     if runner_data:
                         runners.append(runner_data)
                 except Exception as e:
-                    print(f"Error processing runner: {e}")
+                    logger.warning("Error processing runner: %s", e)
                     continue
                     
         except Exception as e:
-            print(f"Error extracting runners: {e}")
+            logger.error("Error extracting runners: %s", e)
         
         return runners
 
     # --- Lazy import helpers -------------------------------------------------
     def _lazy_imports(self):  # pragma: no cover
         global webdriver, Service, By, WebDriverWait, EC, ChromeDriverManager
+        global TimeoutException, WebDriverException
         if webdriver is None:
             from selenium import webdriver as _wd
             webdriver = _wd
@@ -563,34 +918,63 @@ class RaceCardExtractor:
         if ChromeDriverManager is None:
             from webdriver_manager.chrome import ChromeDriverManager as _CDM
             ChromeDriverManager = _CDM
+        if WebDriverException is None:
+            from selenium.common.exceptions import (
+                TimeoutException as _TE,
+                WebDriverException as _WDE,
+            )
+            TimeoutException = _TE
+            WebDriverException = _WDE
 
     def _ensure_bs4(self):  # pragma: no cover
-        global BeautifulSoup
+        global BeautifulSoup, SoupStrainer, _BS_PARSER
         if BeautifulSoup is None:
-            from bs4 import BeautifulSoup as _BS
+            from bs4 import BeautifulSoup as _BS, SoupStrainer as _SS
             BeautifulSoup = _BS
+            SoupStrainer = _SS
+        if _BS_PARSER is None:
+            try:
+                import lxml  # noqa: F401
+                _BS_PARSER = 'lxml'
+            except ImportError:
+                _BS_PARSER = 'html.parser'
+
+    def _parse(self, html: str, anchors_only: bool = False):
+        """Build a soup from html with the fastest available parser.
+
+        anchors_only restricts the parse tree to <a> elements, which is
+        worthwhile for full-page documents; the subtree HTML collected in
+        the browser is already narrowed, so it parses whole.
+        """
+        self._ensure_bs4()
+        if anchors_only:
+            return BeautifulSoup(html, _BS_PARSER, parse_only=SoupStrainer('a'))
+        return BeautifulSoup(html, _BS_PARSER)
     
     def _extract_runner_data(self, runner_block, race_info: Dict, grade: str, distance: str) -> Optional[Dict]:
         """Extract data for a single runner."""
-        dog_name_element = runner_block.find('strong')
+        # One walk over the block picks up both the name <strong> and the
+        # trap <i>, instead of two separate find() traversals
+        dog_name_element = trap_element = None
+        for el in runner_block.find_all(['strong', 'i']):
+            if el.name == 'strong':
+                if dog_name_element is None:
+                    dog_name_element = el
+            elif trap_element is None and _TRAP_CLASS_RE.search(' '.join(el.get('class', []))):
+                trap_element = el
+            if dog_name_element is not None and trap_element is not None:
+                break
         if not dog_name_element:
             return None
-        
+
         dog_name = dog_name_element.get_text().strip()
-        dog_name = re.sub(r'\s*\([MW]\)\s*', '', dog_name).strip()
-        
-        # Extract trap number
-        trap_element = runner_block.find('i', class_=re.compile(r'trap\d+'))
+        dog_name = _MW_RE.sub('', dog_name).strip()
+
         trap_number = 'TBC'
         if trap_element:
-            trap_classes = trap_element.get('class', [])
-            for cls in trap_classes:
-                if cls.startswith('trap') and len(cls) > 4:
-                    try:
-                        trap_number = int(cls.replace('trap', ''))
-                        break
-                    except:
-                        pass
+            m = _TRAP_CLASS_RE.search(' '.join(trap_element.get('class', [])))
+            if m:
+                trap_number = int(m.group(1))
         
         # Extract additional info
         form, forecast, trainer = self._extract_additional_info(runner_block)
@@ -609,35 +993,27 @@ class RaceCardExtractor:
         }
     
     def _extract_additional_info(self, runner_block) -> tuple:
-        """Extract form, forecast, and trainer info."""
+        """Extract form, forecast, and trainer info.
+
+        The info section's text is flattened once and the three labelled
+        fields are pulled by regex from that single string, instead of one
+        find('em', string=...) walk plus a parent get_text() per field.
+        """
         form = forecast = trainer = 'N/A'
-        
+
         info_section = runner_block.find('div', class_='info')
         if info_section:
-            # Extract form
-            form_cell = info_section.find('em', string='Form:')
-            if form_cell and form_cell.parent:
-                form_text = form_cell.parent.get_text()
-                form_match = re.search(r'Form:\s*([A-Z0-9T]+)', form_text)
-                if form_match:
-                    form = form_match.group(1)
-            
-            # Extract SP Forecast
-            forecast_cell = info_section.find('em', string='SP Forecast:')
-            if forecast_cell and forecast_cell.parent:
-                forecast_text = forecast_cell.parent.get_text()
-                forecast_match = re.search(r'SP Forecast:\s*([0-9/]+)', forecast_text)
-                if forecast_match:
-                    forecast = forecast_match.group(1)
-            
-            # Extract trainer
-            trainer_cell = info_section.find('em', string='Tnr:')
-            if trainer_cell and trainer_cell.parent:
-                trainer_text = trainer_cell.parent.get_text()
-                trainer_match = re.search(r'Tnr:\s*([A-Za-z\s]+)', trainer_text)
-                if trainer_match:
-                    trainer = trainer_match.group(1).strip()
-        
+            text = info_section.get_text(' ', strip=True)
+            form_match = _FORM_RE.search(text)
+            if form_match:
+                form = form_match.group(1)
+            forecast_match = _FORECAST_RE.search(text)
+            if forecast_match:
+                forecast = forecast_match.group(1)
+            trainer_match = _TNR_RE.search(text)
+            if trainer_match:
+                trainer = trainer_match.group(1).strip()
+
         return form, forecast, trainer
     
     def _extract_race_grade_and_distance(self, soup) -> tuple:
@@ -647,89 +1023,104 @@ class RaceCardExtractor:
         def parse_grade_and_distance(text: str) -> tuple:
             g = d = 'N/A'
             try:
-                # Grade in parentheses e.g. (A4) or bare token like A4, D2, S1
-                m_g = re.search(r'\(([A-Z]\d{1,2})\)', text)
-                if not m_g:
-                    m_g = re.search(r'\b([A-Z]\d{1,2})\b', text)
-                if m_g:
-                    g = m_g.group(1)
-
-                # Distance tokens like 480m, 285m, 525y, 525yd, 525yds
-                m_d = re.search(r'\b(\d{2,4})\s*(m|M|yds?|YDS?|y)\b', text)
-                if m_d:
-                    unit = m_d.group(2)
-                    # Normalize unit to site style ('m' or 'yds'/'y')
-                    if unit.lower().startswith('m'):
-                        d = f"{m_d.group(1)}m"
-                    elif unit.lower() in {'y', 'yd', 'yds'}:
-                        # Keep as appears (common on Irish distances)
-                        d = f"{m_d.group(1)}y"
-                else:
+                # Single fused scan: grade in parentheses e.g. (A4), bare
+                # grade token like A4/D2/S1, and distance tokens like 480m,
+                # 285m, 525y/525yd/525yds fill from one pass over the text
+                paren_grade = bare_grade = None
+                for m in _GRADE_DIST_RE.finditer(text):
+                    if m.group(1):
+                        if paren_grade is None:
+                            paren_grade = m.group(1)
+                    elif m.group(2):
+                        if bare_grade is None:
+                            bare_grade = m.group(2)
+                    elif d == 'N/A':
+                        unit = m.group(4)
+                        # Normalize unit to site style ('m' or 'yds'/'y')
+                        if unit.lower().startswith('m'):
+                            d = f"{m.group(3)}m"
+                        elif unit.lower() in {'y', 'yd', 'yds'}:
+                            # Keep as appears (common on Irish distances)
+                            d = f"{m.group(3)}y"
+                    if paren_grade is not None and d != 'N/A':
+                        break
+                # Parenthesised grade wins over a bare token, as before
+                if paren_grade is not None:
+                    g = paren_grade
+                elif bare_grade is not None:
+                    g = bare_grade
+                if d == 'N/A':
                     # Last resort: 3-4 digits followed by optional m without word boundary issues
-                    m_d2 = re.search(r'(\d{2,4})\s*m\b', text, re.IGNORECASE)
+                    m_d2 = _DIST_FALLBACK_RE.search(text)
                     if m_d2:
                         d = f"{m_d2.group(1)}m"
             except Exception:
                 pass
             return g, d
 
+        def rank(el) -> int:
+            # Results title first, then the card's titleColumn2, then the
+            # whole card title container - same precedence as the old cascade
+            if el.get('id') == 'circle-race-title':
+                return 0
+            if 'titleColumn2' in el.get('class', []):
+                return 1
+            return 2
+
         try:
-            # 1) Prefer results page title
-            title_el = soup.select_one('span#circle-race-title')
-            if title_el:
-                t = title_el.get_text(" ", strip=True)
-                g, d = parse_grade_and_distance(t)
-                grade = g if g != 'N/A' else grade
-                distance = d if d != 'N/A' else distance
-
-            # 2) Card page specific: parse from titleColumn2 if available
-            if grade == 'N/A' or distance == 'N/A':
-                col2 = soup.select_one('span#title-circle-container span.titleColumn2')
-                if col2:
-                    t2 = col2.get_text(" ", strip=True)
-                    g2, d2 = parse_grade_and_distance(t2)
-                    if grade == 'N/A' and g2 != 'N/A':
-                        grade = g2
-                    if distance == 'N/A' and d2 != 'N/A':
-                        distance = d2
-
-            # 3) Fallback: whole card title container text
-            if grade == 'N/A' or distance == 'N/A':
-                container = soup.find('span', {'id': 'title-circle-container'})
-                if container:
-                    t3 = container.get_text(" ", strip=True)
-                    g3, d3 = parse_grade_and_distance(t3)
-                    if grade == 'N/A' and g3 != 'N/A':
-                        grade = g3
-                    if distance == 'N/A' and d3 != 'N/A':
-                        distance = d3
+            # One selector pass collects every title candidate; their texts
+            # are joined in precedence order and scanned once, instead of
+            # re-running the regex per element
+            candidates = soup.select(
+                'span#circle-race-title,'
+                ' span#title-circle-container span.titleColumn2,'
+                ' span#title-circle-container'
+            )
+            blob = ' | '.join(
+                el.get_text(" ", strip=True)
+                for el in sorted(candidates, key=rank)
+            )
+            if blob:
+                grade, distance = parse_grade_and_distance(blob)
         except Exception as e:
-            print(f"Error extracting grade/distance: {e}")
+            logger.warning("Error extracting grade/distance: %s", e)
 
         return grade, distance
     
-    def _check_for_duplicates(self, all_race_data: List[Dict], runners: List[Dict], race_url: str) -> bool:
-        """Check for duplicate dogs indicating cache issues."""
-        if len(all_race_data) == 0:
+    def _note_recent_dogs(self, runners: List[Dict]) -> None:
+        """Slide freshly-extracted dog names into the duplicate window."""
+        for runner in runners:
+            name = runner['Dog_Name']
+            self._recent_names.append(name)
+            self._recent_counts[name] += 1
+            if len(self._recent_names) > self._DUP_WINDOW:
+                old = self._recent_names.popleft()
+                self._recent_counts[old] -= 1
+                if not self._recent_counts[old]:
+                    del self._recent_counts[old]
+
+    def _check_for_duplicates(self, runners: List[Dict], race_url: str) -> bool:
+        """Check for duplicate dogs indicating cache issues.
+
+        Membership is tested against the rolling window maintained by
+        _note_recent_dogs, so no per-race set rebuild over collected rows.
+        """
+        if not self._recent_names:
             return False
-        
-        recent_races_count = min(6, len(all_race_data))
-        recent_dogs = {r['Dog_Name'] for r in all_race_data[-recent_races_count:]}
         current_dogs = {r['Dog_Name'] for r in runners}
-        overlap = recent_dogs.intersection(current_dogs)
-        
-        return overlap and len(overlap) > len(current_dogs) * 0.5
+        overlap = sum(1 for dog in current_dogs if dog in self._recent_counts)
+        return overlap > len(current_dogs) * 0.5
     
     def _retry_with_cache_bust(self, race_info: Dict, race_url: str) -> List[Dict]:
         """Retry extraction after cache bust."""
-        print(f"    Cache issue detected, applying aggressive cache bust...")
+        logger.info("Cache issue detected, applying aggressive cache bust...")
         from ..utils.browser_utils import smart_cache_bust
         smart_cache_bust(self.driver, force_aggressive=True)
         
         retry_url = race_url + f"?refresh={int(time.time())}"
         self.driver.get(retry_url)
-        time.sleep(5)
-        
+        self._wait_for('#sortContainer', timeout=10)
+
         runners = self._extract_runners_from_race_card(race_info)
         return runners if runners else []
 
@@ -737,7 +1128,10 @@ class RaceCardExtractor:
 def extract_todays_races() -> Optional[object]:
     """Extract only today's race cards."""
     extractor = RaceCardExtractor()
-    return extractor.extract_race_data(mode="today")
+    try:
+        return extractor.extract_race_data(mode="today")
+    finally:
+        extractor.close()
 
 
 def extract_historical_races(start_date: str, end_date: Optional[str] = None) -> Optional[object]:
@@ -748,7 +1142,10 @@ def extract_historical_races(start_date: str, end_date: Optional[str] = None) ->
         end_date: YYYY-MM-DD inclusive end date (defaults to start_date if None)
     """
     extractor = RaceCardExtractor()
-    return extractor.extract_race_data(mode="historical", start_date=start_date, end_date=end_date)
+    try:
+        return extractor.extract_race_data(mode="historical", start_date=start_date, end_date=end_date)
+    finally:
+        extractor.close()
 
 
 if __name__ == "__main__":
@@ -758,8 +1155,14 @@ if __name__ == "__main__":
         print(race_data)
         print("-----------------------------------")
         
-        # Save to data/raw directory
+        # Save to data/raw directory as zstd-compressed Parquet, matching
+        # the pipeline's output format (quick_test and the dry-run loader
+        # both prefer Parquet snapshots)
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
         today_str = datetime.now().strftime("%Y-%m-%d")
-        filename = f"../../../data/raw/race_cards_{today_str}.csv"
-        race_data.to_csv(filename, index=False)
+        filename = f"../../../data/raw/race_cards_{today_str}.parquet"
+        table = pa.Table.from_pandas(race_data, preserve_index=False)
+        pq.write_table(table, filename, compression="zstd", use_dictionary=True)
         print(f"Race data saved to {filename}")
@@ -2,30 +2,81 @@
 Browser utilities for web scraping operations.
 """
 
+import copy
+import functools
 import time
 import os
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+# Any of these means the SPA has rendered something useful again after a
+# cache bust: a race card, a results page, or the meetings index
+_CONTENT_MARKER = (
+    By.CSS_SELECTOR,
+    '#title-circle-container, #sortContainer, a[href*="meeting-races"]',
+)
+
+
+def _wait_for_content(driver, timeout: float, settle: float = 0.0) -> bool:
+    """Wait until page content reappears instead of sleeping a fixed time.
+
+    Returns as soon as a content marker renders; only if nothing appears
+    within timeout does the optional settle sleep run as a last resort.
+    """
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+            EC.presence_of_element_located(_CONTENT_MARKER)
+        )
+        return True
+    except TimeoutException:
+        pass
+    except Exception:
+        pass
+    if settle:
+        time.sleep(settle)
+    return False
 
 
 def setup_chrome_options() -> Options:
     """
     Setup optimized Chrome options for web scraping.
-    
+
+    The 30-odd arguments and prefs are assembled once and memoized;
+    callers get a deep copy so mutating one driver's options never
+    leaks into the next.
+
     Returns:
         Configured Chrome options
     """
+    return copy.deepcopy(_build_chrome_options())
+
+
+@functools.lru_cache(maxsize=1)
+def _build_chrome_options() -> Options:
     chrome_options = Options()
-    chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--headless=new")
     chrome_options.add_argument("--no-sandbox")
     chrome_options.add_argument("--disable-dev-shm-usage")
     chrome_options.add_argument("--disable-gpu")
     chrome_options.add_argument("--disable-images")
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
     chrome_options.add_argument("--disable-plugins")
     chrome_options.add_argument("--disable-extensions")
     chrome_options.add_argument("--disable-java")
     chrome_options.add_argument("--disable-background-timer-throttling")
     chrome_options.add_argument("--disable-renderer-backgrounding")
     chrome_options.add_argument("--disable-backgrounding-occluded-windows")
+    chrome_options.add_argument("--disable-ipc-flooding-protection")
+    chrome_options.add_argument("--disable-features=TranslateUI")
+    chrome_options.add_argument("--mute-audio")
+    chrome_options.add_argument("--hide-scrollbars")
+    chrome_options.add_argument("--metrics-recording-only")
+    # Return from .get() on DOMContentLoaded; the SPA waits poll for the
+    # elements they need anyway, so blocking on subresources wastes time
+    chrome_options.page_load_strategy = "eager"
     chrome_options.add_argument("--window-size=1366,768")
     chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
     chrome_options.add_argument("--disable-blink-features=AutomationControlled")
@@ -77,8 +128,9 @@ def smart_cache_bust(driver, force_aggressive: bool = False):
                 driver.execute_script("window.location.reload(true);")  # Hard reload
             except:
                 pass
-            time.sleep(8)  # Longer wait for track switches
-            
+            # Poll for re-rendered content; worst case matches the old 8s
+            _wait_for_content(driver, 8)
+
             print("    Aggressive cache bust completed")
         else:
             print("    Performing light cache bust (same track)...")
@@ -100,8 +152,10 @@ def smart_cache_bust(driver, force_aggressive: bool = False):
                 """)
             except:
                 pass
-            time.sleep(2)  # Much shorter wait for same track
-            
+            # Nothing reloads here, so this returns as soon as the page
+            # still shows content - usually immediately
+            _wait_for_content(driver, 2)
+
             print("    Light cache bust completed")
         
     except Exception as e:
@@ -143,11 +197,11 @@ def aggressive_cache_bust(driver):
         # Navigate to main page with cache-busting parameters
         main_url = f"https://greyhoundbet.racingpost.com/?nocache={int(time.time())}&refresh=true"
         driver.get(main_url)
-        time.sleep(3)
-        
+        _wait_for_content(driver, 8)
+
         # Force a hard refresh
         driver.refresh()
-        time.sleep(2)
+        _wait_for_content(driver, 5)
         
         print("    Cache bust completed")
         
@@ -2,6 +2,7 @@
 Configuration settings for the greyhound racing data pipeline.
 """
 
+import functools
 import os
 from pathlib import Path
 from typing import Dict, Any
@@ -21,10 +22,22 @@ class Config:
     RAW_RESULTS_DIR = RAW_DATA_DIR / "results"
     # Subfolder specifically for dog stats
     RAW_STATS_DIR = RAW_DATA_DIR / "stats"
+    # Pipeline-level result cache (parquet blobs + sqlite index)
+    CACHE_DIR = DATA_DIR / "cache"
+    # Resolved once at import so per-run writers reuse the same Path object
+    SUMMARY_DIR = (PROJECT_ROOT / "logs").resolve()
     
     # URLs
     RACING_POST_URL = "https://greyhoundbet.racingpost.com/"
     GREYHOUND_STATS_URL = "https://greyhoundstats.co.uk"
+
+    # Output serialization format: "parquet" (columnar, compressed) or "csv" (legacy)
+    OUTPUT_FORMAT = "parquet"
+
+    # Pipeline result cache settings
+    CACHE_SETTINGS = {
+        "max_size_mb": 512,  # LRU-evict cache blobs beyond this total size
+    }
     
     # Extraction settings
     EXTRACTION_SETTINGS = {
@@ -90,6 +103,7 @@ class Config:
             cls.RAW_DATA_DIR,
             cls.RAW_RESULTS_DIR,
             cls.RAW_STATS_DIR,
+            cls.CACHE_DIR,
             cls.PROCESSED_DATA_DIR,
             cls.LOGS_DIR,
             cls.CONFIG_DIR
@@ -113,10 +127,17 @@ class Config:
         if date_str is None:
             from datetime import datetime
             date_str = datetime.now().strftime("%Y-%m-%d")
-        
+
+        # The default date is resolved before the memoized lookup so a run
+        # crossing midnight still gets the new day's path
+        return cls._resolve_file_path(file_type, date_str)
+
+    @classmethod
+    @functools.lru_cache(maxsize=64)
+    def _resolve_file_path(cls, file_type: str, date_str: str) -> Path:
         pattern = cls.FILE_PATTERNS.get(file_type, f"{file_type}_{date_str}.csv")
         filename = pattern.format(date=date_str)
-        
+
         if file_type == "race_results":
             return cls.RAW_RESULTS_DIR / filename
         if file_type == "dog_stats":
@@ -129,28 +150,35 @@ class Config:
             return cls.LOGS_DIR / filename
         else:
             return cls.DATA_DIR / filename
-    
+
+    # Parsed custom configs keyed by (filename, mtime): repeat loads skip
+    # the disk read and JSON parse, edits still take effect via the mtime
+    _custom_config_cache: Dict[tuple, Dict[str, Any]] = {}
+
     @classmethod
     def load_custom_config(cls, config_file: str = "custom_config.json") -> Dict[str, Any]:
         """
         Load custom configuration from JSON file.
-        
+
         Args:
             config_file: Name of the config file
-            
+
         Returns:
             Dictionary with custom configuration
         """
         import json
-        
+
         config_path = cls.CONFIG_DIR / config_file
         if config_path.exists():
             try:
-                with open(config_path, 'r') as f:
-                    return json.load(f)
+                cache_key = (config_file, config_path.stat().st_mtime)
+                if cache_key not in cls._custom_config_cache:
+                    with open(config_path, 'r') as f:
+                        cls._custom_config_cache[cache_key] = json.load(f)
+                return cls._custom_config_cache[cache_key]
             except Exception as e:
                 print(f"Error loading custom config: {e}")
-        
+
         return {}
     
     @classmethod
@@ -8,32 +8,48 @@ from datetime import datetime
 from typing import Optional
 
 
-def save_to_csv(dataframe: pd.DataFrame, filename: Optional[str] = None, directory: str = "data/raw") -> str:
+def save_to_csv(dataframe: pd.DataFrame, filename: Optional[str] = None,
+                directory: str = "data/raw", compression: Optional[str] = None) -> str:
     """
     Save DataFrame to CSV file.
-    
+
     Args:
         dataframe: DataFrame to save
         filename: Optional filename, defaults to date-based name
         directory: Directory to save file in
-        
+        compression: Optional codec (e.g. "gzip"); appends .gz to the name
+
     Returns:
         Path to saved file
     """
     if dataframe is None or dataframe.empty:
         raise ValueError("Cannot save empty or None DataFrame")
-    
+
     if filename is None:
         today_str = datetime.now().strftime("%Y-%m-%d")
         filename = f"race_cards_{today_str}.csv"
-    
+
     # Ensure directory exists
     os.makedirs(directory, exist_ok=True)
-    
+
     filepath = os.path.join(directory, filename)
-    dataframe.to_csv(filepath, index=False)
+    if compression == "gzip" and not filepath.endswith(".gz"):
+        filepath += ".gz"
+    try:
+        # pyarrow streams the CSV out in C in large batches, which is
+        # noticeably faster than to_csv's row-at-a-time writer on the
+        # wide historical frames
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+        table = pa.Table.from_pandas(dataframe, preserve_index=False)
+        with pa.output_stream(filepath, compression=compression) as sink:
+            pa_csv.write_csv(
+                table, sink, write_options=pa_csv.WriteOptions(batch_size=65536)
+            )
+    except Exception:
+        dataframe.to_csv(filepath, index=False, compression=compression or "infer")
     print(f"Data saved to {filepath}")
-    
+
     return filepath
 
 
@@ -78,14 +94,22 @@ def get_latest_file(directory: str, pattern: str = "*.csv") -> Optional[str]:
     Returns:
         Path to latest file or None if no files found
     """
-    import glob
-    
-    if not os.path.exists(directory):
-        return None
-    
-    files = glob.glob(os.path.join(directory, pattern))
-    if not files:
+    import fnmatch
+
+    # One scandir pass: DirEntry caches its stat, so each file is touched
+    # once instead of glob stat'ing matches and max re-stat'ing them
+    latest = None
+    latest_mtime = -1.0
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not entry.is_file() or not fnmatch.fnmatch(entry.name, pattern):
+                    continue
+                mtime = entry.stat().st_mtime
+                if mtime > latest_mtime:
+                    latest_mtime = mtime
+                    latest = entry.path
+    except OSError:
         return None
-    
-    # Return most recently modified file
-    return max(files, key=os.path.getmtime)
+
+    return latest
@@ -1,36 +1,202 @@
 """Logging utilities for standardized logger configuration across the pipeline."""
 from __future__ import annotations
+import atexit
+import functools
 import logging
+import os
+import queue
+import sys
+import threading
+import time
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
 from typing import Optional
-from .config import config
+
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
 
 _LOGGERS_CREATED = False
+# Serializes the first configuration; the fast path stays lock-free
+_CONFIG_LOCK = threading.Lock()
+# (level, format, log file) captured from config on first configuration;
+# they are install-time constants, so force reconfigures reuse them
+_SETTINGS: Optional[tuple] = None
+_MEMORY_HANDLER: Optional[MemoryHandler] = None
+_FILE_HANDLER: Optional[logging.FileHandler] = None
+_LISTENER: Optional[QueueListener] = None
+_ATEXIT_REGISTERED = False
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that reuses the rendered timestamp within one second.
+
+    strftime dominates Formatter.format for bursts of records; records in
+    the same second share the cached base string with only the millisecond
+    suffix recomputed. Formatting happens solely on the listener thread,
+    so the one-slot cache needs no lock.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._second = -1
+        self._second_str = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        second = int(record.created)
+        if second != self._second:
+            self._second_str = time.strftime(
+                datefmt or self.default_time_format, self.converter(record.created)
+            )
+            self._second = second
+        if datefmt:
+            return self._second_str
+        if self.default_msec_format:
+            return self.default_msec_format % (self._second_str, record.msecs)
+        return self._second_str
+
+
+class _BufferedFileHandler(RotatingFileHandler):
+    """Size-rotated file handler without the per-record flush.
+
+    Records accumulate in the stream's block buffer so the write syscall
+    happens once per buffer-full rather than once per record. ERROR and
+    above still flush immediately; flush_log_handlers() and the atexit
+    hook drain the rest. Rotation bounds the file (and the page cache it
+    occupies) over long crawl sessions.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except Exception:
+            self.handleError(record)
 
 def configure_root_logging(force: bool = False) -> None:
     """Configure root logging once using settings from config.
     Args:
         force: If True, reconfigure even if already configured.
     """
-    global _LOGGERS_CREATED
     if _LOGGERS_CREATED and not force:
         return
-    config.ensure_directories()
-    log_file = config.get_file_path("logs")
-    handlers: list[logging.Handler] = []
-    file_handler = logging.FileHandler(log_file)
-    stream_handler = logging.StreamHandler()
-    handlers.extend([file_handler, stream_handler])
+    # Double-checked: only the losing thread(s) of the first call (or a
+    # force reconfigure) block here, then see the flag set and bail
+    with _CONFIG_LOCK:
+        if _LOGGERS_CREATED and not force:
+            return
+        _configure_root_logging_locked(force)
+
+def _configure_root_logging_locked(force: bool) -> None:
+    global _LOGGERS_CREATED, _SETTINGS, _MEMORY_HANDLER, _FILE_HANDLER, _LISTENER, _ATEXIT_REGISTERED
+    if _SETTINGS is None:
+        # Imported here so merely importing get_logger does not drag in the
+        # config package (and its directory setup) before logging is used
+        from .config import config
+        config.ensure_directories()
+        _SETTINGS = (
+            _LEVELS.get(config.LOGGING_SETTINGS.get("level", "INFO"), logging.INFO),
+            config.LOGGING_SETTINGS.get("format", "%(asctime)s - %(levelname)s - %(message)s"),
+            config.get_file_path("logs"),
+            config.LOGGING_SETTINGS.get("max_file_size", 10 * 1024 * 1024),
+            config.LOGGING_SETTINGS.get("backup_count", 5),
+        )
+    level, log_format, log_file, max_bytes, backup_count = _SETTINGS
+    formatter = _CachedTimeFormatter(log_format)
+    # delay=True defers the file open to the first record actually written
+    file_handler = _BufferedFileHandler(
+        log_file, maxBytes=max_bytes, backupCount=backup_count,
+        encoding="utf-8", delay=True,
+    )
+    file_handler.setFormatter(formatter)
+    # Batch file writes: records buffer in memory and drain on capacity, on
+    # ERROR, or via flush_log_handlers(), instead of one write per record
+    memory_handler = MemoryHandler(capacity=200, flushLevel=logging.ERROR, target=file_handler)
+    handlers: list[logging.Handler] = [memory_handler]
+    # Mirror records to stderr only for interactive runs (or when forced
+    # via env); headless/CI runs skip the second write per record
+    if os.environ.get("GREYHOUND_LOG_STDERR") or (
+        sys.stderr is not None and sys.stderr.isatty()
+    ):
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+        handlers.append(stream_handler)
+    # Emitting threads only enqueue the record (no write syscall, no
+    # timestamp formatting); a single listener thread owns the real
+    # handlers and does the actual I/O off the hot path
+    if _LISTENER is not None:
+        _LISTENER.stop()
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    # The queue handler only merges args into the message ("%(message)s");
+    # asctime and the rest are rendered by the listener-side formatter
     logging.basicConfig(
-        level=getattr(logging, config.LOGGING_SETTINGS.get("level", "INFO")),
-        format=config.LOGGING_SETTINGS.get("format", "%(asctime)s - %(levelname)s - %(message)s"),
-        handlers=handlers,
+        level=level,
+        format="%(message)s",
+        handlers=[QueueHandler(log_queue)],
         force=force,
     )
+    _MEMORY_HANDLER = memory_handler
+    _FILE_HANDLER = file_handler
+    _LISTENER = listener
+    if not _ATEXIT_REGISTERED:
+        atexit.register(_shutdown_logging)
+        _ATEXIT_REGISTERED = True
     _LOGGERS_CREATED = True
 
-def get_logger(name: Optional[str] = None) -> logging.Logger:
-    """Return a configured logger. Ensures root configuration."""
+def _shutdown_logging() -> None:
+    """Drain the queue and buffers at interpreter exit."""
+    global _LISTENER
+    if _LISTENER is not None:
+        listener, _LISTENER = _LISTENER, None
+        listener.stop()
+    flush_log_handlers()
+
+def flush_log_handlers() -> None:
+    """Drain any buffered log records to the log file."""
+    if _MEMORY_HANDLER is not None:
+        _MEMORY_HANDLER.flush()
+    if _FILE_HANDLER is not None:
+        _FILE_HANDLER.flush()
+
+@functools.lru_cache(maxsize=None)
+def _get_logger(name: str) -> logging.Logger:
     configure_root_logging()
-    return logging.getLogger(name or __name__)
+    return logging.getLogger(name)
+
+def get_logger(name: Optional[str] = None) -> logging.Logger:
+    """Return a configured logger. Ensures root configuration.
+
+    Memoized per name: repeat acquisitions are a cache lookup and skip
+    the already-configured check entirely.
+    """
+    return _get_logger(name or __name__)
+
+def get_leveled_logger(name: Optional[str] = None) -> tuple[logging.Logger, bool, bool]:
+    """Return (logger, debug_enabled, info_enabled) for hot loops.
+
+    Callers cache the booleans once and guard expensive argument
+    construction with them, e.g.::
+
+        log, debug_on, _ = get_leveled_logger(__name__)
+        if debug_on:
+            log.debug("raw card: %s", format_runners(runners))
+    """
+    lg = get_logger(name)
+    return lg, lg.isEnabledFor(logging.DEBUG), lg.isEnabledFor(logging.INFO)
 
-__all__ = ["get_logger", "configure_root_logging"]
+__all__ = [
+    "get_logger",
+    "get_leveled_logger",
+    "configure_root_logging",
+    "flush_log_handlers",
+]
@@ -0,0 +1,103 @@
+"""
+Pipeline-level result cache for expensive extraction steps.
+
+Step results are stored as Parquet blobs under data/cache with a small SQLite
+index used for lookups and LRU eviction, so repeated runs with identical
+parameters (common in dev/tuning loops) skip network extraction entirely.
+"""
+
+import hashlib
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+from .config import config
+
+
+class PipelineCache:
+    """Content-addressed cache with LRU eviction for pipeline step results."""
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_size_bytes: Optional[int] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else config.CACHE_DIR
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        if max_size_bytes is None:
+            max_size_bytes = config.CACHE_SETTINGS["max_size_mb"] * 1024 * 1024
+        self.max_size_bytes = max_size_bytes
+        self._db_path = self.cache_dir / "index.sqlite"
+        self._init_db()
+
+    @staticmethod
+    def make_key(step: str, *parts) -> str:
+        """Build a cache key from a step name and its identifying parameters."""
+        raw = "|".join([step] + [str(p) for p in parts])
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        """Return the cached DataFrame for key, or None on miss."""
+        with sqlite3.connect(self._db_path) as conn:
+            row = conn.execute(
+                "SELECT path FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            blob_path = Path(row[0])
+            if not blob_path.exists():
+                conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                return None
+            conn.execute(
+                "UPDATE entries SET last_used = ? WHERE key = ?", (time.time(), key)
+            )
+        try:
+            return pd.read_parquet(blob_path)
+        except Exception as e:
+            print(f"Error reading cache entry {key}: {e}")
+            return None
+
+    def put(self, key: str, dataframe: pd.DataFrame) -> None:
+        """Store a DataFrame under key, evicting least-recently-used entries if needed."""
+        blob_path = self.cache_dir / f"{key}.parquet"
+        try:
+            dataframe.to_parquet(blob_path, engine="pyarrow", compression="zstd", index=False)
+        except Exception as e:
+            print(f"Error writing cache entry {key}: {e}")
+            return
+        size = blob_path.stat().st_size
+        now = time.time()
+        with sqlite3.connect(self._db_path) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (key, path, size, last_used) VALUES (?, ?, ?, ?)",
+                (key, str(blob_path), size, now),
+            )
+        self._evict()
+
+    def clear(self) -> None:
+        """Remove all cache entries."""
+        with sqlite3.connect(self._db_path) as conn:
+            for (path,) in conn.execute("SELECT path FROM entries"):
+                Path(path).unlink(missing_ok=True)
+            conn.execute("DELETE FROM entries")
+
+    def _init_db(self) -> None:
+        with sqlite3.connect(self._db_path) as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, path TEXT, size INTEGER, last_used REAL)"
+            )
+
+    def _evict(self) -> None:
+        """Drop least-recently-used entries until total size fits the cap."""
+        with sqlite3.connect(self._db_path) as conn:
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if total <= self.max_size_bytes:
+                return
+            for key, path, size in conn.execute(
+                "SELECT key, path, size FROM entries ORDER BY last_used ASC"
+            ).fetchall():
+                Path(path).unlink(missing_ok=True)
+                conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                total -= size
+                if total <= self.max_size_bytes:
+                    break
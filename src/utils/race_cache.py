@@ -0,0 +1,83 @@
+"""
+On-disk cache of parsed race-card runners.
+
+Entries are JSON files named by a SHA-256 fingerprint of (race URL, date),
+written atomically via os.replace so a crashed run never leaves a torn
+entry. Freshness is per entry: callers pass a TTL matching how mutable
+the page is (today's cards change until off-time, settled results never
+do). The directory is capped at 100 MB with oldest-first eviction, so
+retries and repeat runs skip both the network fetch and the parse for
+unchanged race cards.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from .config import config
+
+# Today's cards mutate (non-runners, reserves) so they go stale quickly;
+# settled results are immutable and live until size-capped eviction.
+TTL_TODAY = 600
+TTL_RESULT = None
+
+_MAX_BYTES = 100 * 1024 * 1024
+
+
+def make_key(race_url: str, date: str) -> str:
+    """Build the cache key for a race card URL on a given date."""
+    return hashlib.sha256(f"{race_url}|{date}".encode("utf-8")).hexdigest()
+
+
+def get(key: str, ttl: Optional[float] = TTL_TODAY) -> Optional[List[dict]]:
+    """Return the cached runners list for key, or None on miss/expiry.
+
+    ttl is the entry's maximum age in seconds; None never expires.
+    """
+    path = _cache_dir() / f"{key}.json"
+    try:
+        if ttl is not None and time.time() - path.stat().st_mtime > ttl:
+            return None
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def put(key: str, runners: List[dict]) -> None:
+    """Store a runners list under key, evicting oldest entries past the size cap."""
+    directory = _cache_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{key}.json"
+    tmp = path.with_suffix(".json.tmp")
+    try:
+        tmp.write_text(json.dumps(runners))
+        os.replace(tmp, path)
+    except OSError:
+        return
+    _evict(directory)
+
+
+def _cache_dir() -> Path:
+    return config.CACHE_DIR / "racecards"
+
+
+def _evict(directory: Path) -> None:
+    """Drop oldest entries until the directory fits the size cap."""
+    try:
+        entries = sorted(
+            (p.stat().st_mtime, p.stat().st_size, p) for p in directory.glob("*.json")
+        )
+    except OSError:
+        return
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in entries:
+        if total <= _MAX_BYTES:
+            break
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total -= size
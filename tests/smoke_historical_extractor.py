@@ -4,19 +4,29 @@ Lightweight smoke test for historical extraction plumbing (no network).
 This test imports the extractor and validates helper methods on date ranges.
 """
 from datetime import datetime
+import os
 import sys
-from pathlib import Path
 
-# Ensure project root is on sys.path when running the test directly
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.append(str(ROOT))
+# Ensure project root is on sys.path when running the test directly;
+# plain string ops avoid Path construction and the entry goes first so
+# imports short-circuit instead of scanning the whole path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from functools import lru_cache
 
 from src.extractors.race_card_extractor import RaceCardExtractor
 
 
+@lru_cache(maxsize=1)
+def _extractor() -> RaceCardExtractor:
+    # One shared driverless instance; construction is the slow part here
+    return RaceCardExtractor()
+
+
 def test_date_iter_and_url():
-    ext = RaceCardExtractor()
+    ext = _extractor()
     # Test date iteration
     dates = list(ext._iter_dates_inclusive("2025-09-05", "2025-09-07"))
     assert dates == ["2025-09-05", "2025-09-06", "2025-09-07"]